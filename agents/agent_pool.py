@@ -0,0 +1,203 @@
+"""
+Agent Pool for Agent Brown Savings Banking Content Compliance Review System
+This module keeps pre-built agents for reuse, so serving many reviews does not pay for
+agent construction, config parsing and LLM client setup on every request.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Number of recent wait times kept for percentile reporting
+WAIT_SAMPLES = 1000
+
+class AgentPool:
+    """
+    Pool of interchangeable agents built by one factory from one config
+
+    Agents are reset before they go back into the pool, so every caller gets
+    an agent with clean conversation state. A reused agent keeps its LLM
+    client, and with it the client's open HTTP connections.
+    """
+
+    def __init__(self, factory, config_list, size=1, max_size=None):
+        """
+        Build the pool
+
+        Args:
+            factory (callable): factory(config_list) returning a new agent
+            config_list: Configuration for the LLM
+            size (int, optional): Agents built up front
+            max_size (int, optional): Most agents the pool will build, defaults to size
+        """
+        self.factory = factory
+        self.config_list = config_list
+        self.max_size = max(max_size or size, size)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._built = 0
+        self._build_seconds = 0.0
+        self._acquisitions = 0
+        self._on_demand_builds = 0
+        self._on_demand_build_seconds = 0.0
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+
+        for _ in range(size):
+            self._reserve()
+            self._idle.put(self._build())
+
+    def _reserve(self):
+        with self._lock:
+            if self._built < self.max_size:
+                self._built += 1
+                return True
+            return False
+
+    def _build(self, on_demand=False):
+        # The caller has already reserved a slot with _reserve()
+        start = time.perf_counter()
+        try:
+            agent = self.factory(self.config_list)
+        except Exception:
+            with self._lock:
+                self._built -= 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._build_seconds += elapsed
+            if on_demand:
+                self._on_demand_builds += 1
+                self._on_demand_build_seconds += elapsed
+        return agent
+
+    def ensure_max_size(self, max_size):
+        """
+        Let the pool grow to at least max_size agents, built on demand
+
+        Args:
+            max_size (int): Most agents the pool should be able to build
+        """
+        with self._lock:
+            self.max_size = max(self.max_size, max_size)
+
+    def acquire(self, timeout=None):
+        """
+        Take an agent from the pool, building one if the pool may still grow
+
+        Time spent building an agent on demand is reported separately from
+        time spent waiting for an idle agent.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an agent before raising queue.Empty
+
+        Returns:
+            The agent
+        """
+        start = time.perf_counter()
+        try:
+            agent = self._idle.get_nowait()
+        except queue.Empty:
+            if self._reserve():
+                agent = self._build(on_demand=True)
+                with self._lock:
+                    self._acquisitions += 1
+                return agent
+            agent = self._idle.get(timeout=timeout)
+
+        with self._lock:
+            self._acquisitions += 1
+            self._waits.append(time.perf_counter() - start)
+        return agent
+
+    def release(self, agent):
+        """
+        Reset an agent's conversation state and return it to the pool
+
+        Args:
+            agent: An agent previously returned by acquire()
+        """
+        agent.reset()
+        self._idle.put(agent)
+
+    @contextmanager
+    def agent(self, timeout=None):
+        """
+        Borrow an agent for the duration of a with block
+
+        Args:
+            timeout (float, optional): Seconds to wait for an agent
+
+        Yields:
+            The agent
+        """
+        agent = self.acquire(timeout)
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    def stats(self):
+        """
+        Get pool usage statistics
+
+        Returns:
+            dict: Agents built, acquisitions, construction time avoided and spent
+                on demand, and wait times for idle agents
+        """
+        with self._lock:
+            built = self._built
+            acquisitions = self._acquisitions
+            build_seconds = self._build_seconds
+            on_demand_builds = self._on_demand_builds
+            on_demand_build_seconds = self._on_demand_build_seconds
+            waits = sorted(self._waits)
+
+        mean_build = build_seconds / built if built else 0.0
+        reused = max(acquisitions - built, 0)
+
+        def percentile(fraction):
+            return waits[min(int(len(waits) * fraction), len(waits) - 1)] if waits else 0.0
+
+        return {
+            "agents_built": built,
+            "acquisitions": acquisitions,
+            "reuses": reused,
+            "mean_construction_seconds": mean_build,
+            "construction_seconds_avoided": reused * mean_build,
+            "on_demand_builds": on_demand_builds,
+            "on_demand_construction_seconds": on_demand_build_seconds,
+            "wait_p50_seconds": percentile(0.5),
+            "wait_p99_seconds": percentile(0.99),
+            "wait_max_seconds": waits[-1] if waits else 0.0
+        }
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_agent_pool(factory, config_list, size=1, max_size=None):
+    """
+    Get the shared pool for a factory and config, creating it on first use
+
+    If the pool already exists with a smaller max_size, it is raised so the
+    pool can grow to the requested size on demand.
+
+    Args:
+        factory (callable): factory(config_list) returning a new agent
+        config_list: Configuration for the LLM
+        size (int, optional): Agents built up front when the pool is created
+        max_size (int, optional): Most agents the pool will build
+
+    Returns:
+        AgentPool: The pool
+    """
+    # Key on the factory itself: lambdas and closures in one scope share a qualname
+    key = (factory, json.dumps(config_list, sort_keys=True, default=str))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = AgentPool(factory, config_list, size, max_size)
+        else:
+            _pools[key].ensure_max_size(max(max_size or size, size))
+        return _pools[key]
@@ -3,7 +3,14 @@ Compliance Reviewer Agent for Agent Brown Savings Banking Content Compliance Rev
 This module defines the Compliance Reviewer agent that reviews content against UK banking regulations.
 """
 
-from autogen import AssistantAgent
+import uuid
+
+from autogen import AssistantAgent, UserProxyAgent
+
+from agents.agent_pool import get_agent_pool
+from utils.batch_review import content_hash
+from utils.prescreen import build_review_message
+from utils.transcript import archive_and_reset
 
 def create_compliance_reviewer_agent(config_list):
     """
@@ -61,6 +68,67 @@ def create_compliance_reviewer_agent(config_list):
         llm_config={"config_list": config_list}
     )
 
+def create_review_requester_agent(config_list=None):
+    """
+    Create and return a non-interactive user proxy that submits content for review
+    
+    Args:
+        config_list: Unused; accepted so the proxy can be pooled like the other agents
+        
+    Returns:
+        UserProxyAgent: The review requester
+    """
+    return UserProxyAgent(
+        name="ReviewRequester",
+        human_input_mode="NEVER",  # No human input for automated reviews
+        max_consecutive_auto_reply=0,  # One review per item, no follow-up rounds
+        code_execution_config=False,
+        system_message="You submit Agent Brown Savings content for compliance review."
+    )
+
+def create_review_fn(config_list, transcript=None, pool_size=1):
+    """
+    Create a function that runs one non-interactive compliance review per call
+    
+    Agents are borrowed from shared pools, so repeated reviews reuse already
+    built agents and their LLM connections, and up to pool_size reviews can
+    run concurrently. Both agents are reset after every review, so memory
+    stays flat however many reviews are run; the conversation is kept in the
+    transcript log under an id made of the content hash and a random suffix,
+    so ids stay unique across processes appending to the same log.
+    
+    Args:
+        config_list: Configuration for the LLM
+        transcript (TranscriptLog, optional): Log to record each review conversation in
+        pool_size (int, optional): Agents of each kind to keep ready
+        
+    Returns:
+        callable: review_fn(content, prescreen) returning the reviewer's reply.
+            review_fn.pool_stats() reports pool usage.
+    """
+    reviewer_pool = get_agent_pool(create_compliance_reviewer_agent, config_list, size=pool_size)
+    requester_pool = get_agent_pool(create_review_requester_agent, config_list, size=pool_size)
+    def review_fn(content, prescreen):
+        with reviewer_pool.agent() as compliance_agent, requester_pool.agent() as user_proxy:
+            user_proxy.initiate_chat(
+                compliance_agent,
+                message=build_review_message(content, prescreen),
+                clear_history=True
+            )
+            review = user_proxy.last_message(compliance_agent)["content"]
+            conversation_id = f"review-{content_hash(content)[:16]}-{uuid.uuid4().hex[:12]}"
+            archive_and_reset(transcript, conversation_id, user_proxy, [user_proxy, compliance_agent])
+        return review
+    
+    def pool_stats():
+        return {
+            "compliance_reviewer": reviewer_pool.stats(),
+            "review_requester": requester_pool.stats()
+        }
+    
+    review_fn.pool_stats = pool_stats
+    return review_fn
+
 def analyze_compliance(content, desktop_limit=None, mobile_limit=None):
     """
     Helper function to prepare content for compliance analysis
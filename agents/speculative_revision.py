@@ -0,0 +1,189 @@
+"""
+Speculative Revision for Agent Brown Savings Banking Content Compliance Review System
+This module drafts a revision from the prescreen findings while the compliance review runs,
+then accepts or patches the draft once the review lands.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.compliance_rules import check_common_issues
+from utils.prescreen import build_review_message, format_issues_text
+
+# First line the reviewer uses to accept a speculative draft
+ACCEPT_MARKER = "ACCEPT"
+
+def create_ask_fn(agent, name):
+    """
+    Create a function that sends one message to an agent and returns its reply
+
+    Each function gets its own user proxy, so conversations run in parallel
+    never share history.
+
+    Args:
+        agent: The agent to ask
+        name (str): Name for the user proxy
+
+    Returns:
+        callable: ask(message) returning the agent's reply
+    """
+    from autogen import UserProxyAgent
+
+    user_proxy = UserProxyAgent(
+        name=name,
+        human_input_mode="NEVER",
+        max_consecutive_auto_reply=0,  # One reply per message
+        code_execution_config=False,
+        system_message="You coordinate content reviews for Agent Brown Savings."
+    )
+
+    def ask(message):
+        user_proxy.initiate_chat(agent, message=message, clear_history=True)
+        return user_proxy.last_message(agent)["content"]
+
+    return ask
+
+def build_speculative_revision_message(content, prescreen):
+    """
+    Build the message asking the Content Creator for a revision before the review is in
+
+    Args:
+        content (str): The original content
+        prescreen (dict): Result of prescreen_content for the content
+
+    Returns:
+        str: The revision request message
+    """
+    return f"""Please revise this content for Agent Brown Savings customers. The compliance review
+is still running, so revise it based on the local checks below and general FCA rules.
+
+Original Content:
+"{content}"
+
+Current word count: {prescreen['word_count']} words
+Desktop word limit: {prescreen['desktop_limit'] or 'No limit'} (Status: {prescreen['desktop_status']})
+Mobile word limit: {prescreen['mobile_limit'] or 'No limit'} (Status: {prescreen['mobile_status']})
+{format_issues_text(prescreen['issues'])}
+Provide revised versions for desktop and mobile."""
+
+def build_acceptance_message(content, review, draft):
+    """
+    Build the message asking the Compliance Reviewer whether a draft addresses its review
+
+    Args:
+        content (str): The original content
+        review (str): The Compliance Reviewer's review of the original
+        draft (str): The speculative revision
+
+    Returns:
+        str: The acceptance check message
+    """
+    return f"""You reviewed this content:
+"{content}"
+
+Your review:
+{review}
+
+A revision was drafted in parallel with your review:
+{draft}
+
+If the revision addresses every finding in your review, reply with {ACCEPT_MARKER} alone on the first line.
+Otherwise list each finding it does not yet address."""
+
+def build_patch_message(review, draft, remaining):
+    """
+    Build the message asking the Content Creator to patch a speculative draft
+
+    Args:
+        review (str): The Compliance Reviewer's review of the original
+        draft (str): The speculative revision
+        remaining (str): Findings the draft does not yet address
+
+    Returns:
+        str: The patch request message
+    """
+    return f"""Your revision was drafted before the compliance review finished. Here is the review:
+{review}
+
+Your revision:
+{draft}
+
+Findings not yet addressed:
+{remaining}
+
+Update the revision so it addresses these findings, keeping the desktop and mobile versions."""
+
+def is_acceptance(verdict):
+    """
+    Check whether the reviewer's verdict accepts the revision
+
+    Only a first line that is exactly ACCEPT_MARKER counts, so replies such as
+    "Acceptable, but..." or "Accepted with caveats" are treated as findings.
+
+    Args:
+        verdict (str): The reviewer's reply to the acceptance message
+
+    Returns:
+        bool: True if the revision was accepted
+    """
+    lines = verdict.strip().splitlines()
+    return bool(lines) and lines[0].strip() == ACCEPT_MARKER
+
+def run_speculative_revision(ask_reviewer, ask_creator, content, prescreen):
+    """
+    Review content and draft its revision concurrently
+
+    The Content Creator starts on a revision seeded with the prescreen findings
+    while the Compliance Reviewer reviews the original. The draft is accepted
+    if none of the prescreen findings remain and the reviewer confirms it
+    addresses the review; otherwise the Content Creator patches it. In the
+    common case this takes two LLM rounds instead of review, revise, re-review.
+
+    Args:
+        ask_reviewer (callable): ask(message) for the Compliance Reviewer
+        ask_creator (callable): ask(message) for the Content Creator
+        content (str): The content to review
+        prescreen (dict): Result of prescreen_content for the content
+
+    Returns:
+        dict: The review, final draft, "status" ("accepted" or "patched") and stage timings
+    """
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        review_future = executor.submit(ask_reviewer, build_review_message(content, prescreen))
+        draft_future = executor.submit(ask_creator, build_speculative_revision_message(content, prescreen))
+        review = review_future.result()
+        draft = draft_future.result()
+
+    parallel_done = time.perf_counter()
+
+    # Local check first: any prescreen finding still present rules out acceptance.
+    # Only exact phrases count here, as a fuzzy near miss would force a patch
+    # round the reviewer never asked for; the reviewer still judges variants.
+    seeded_types = {issue["type"] for issue in prescreen["issues"]}
+    unresolved = [issue for issue in check_common_issues(draft, fuzzy=False) if issue["type"] in seeded_types]
+
+    if unresolved:
+        remaining = format_issues_text(unresolved).strip()
+    else:
+        verdict = ask_reviewer(build_acceptance_message(content, review, draft))
+        remaining = None if is_acceptance(verdict) else verdict
+
+    if remaining is None:
+        status = "accepted"
+    else:
+        draft = ask_creator(build_patch_message(review, draft, remaining))
+        status = "patched"
+
+    finished = time.perf_counter()
+
+    return {
+        "review": review,
+        "draft": draft,
+        "status": status,
+        "timings": {
+            "parallel_stage": parallel_done - start,
+            "total": finished - start
+        }
+    }
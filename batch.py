@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Batch Review Script for the Banking Content Compliance Review System
+This script reviews a batch of content items, sending each distinct body to the compliance reviewer once.
+"""
+
+import os
+import sys
+import json
+import dotenv
+
+# Import our custom modules
+from agents.compliance_reviewer import create_review_fn
+from utils.batch_review import load_batch_items, run_batch_review
+from utils.transcript import TranscriptLog
+
+# Load environment variables from env.local
+dotenv.load_dotenv('env.local')
+
+# Get the OpenAI API key
+openai_api_key = os.environ.get("OPENAI_API_KEY")
+if not openai_api_key or openai_api_key == "your_openai_api_key_here":
+    raise ValueError("Please set your OpenAI API key in env.local")
+
+# Configure OpenAI
+config_list = [
+    {
+        "model": "gpt-4o-mini",
+        "api_key": openai_api_key
+    }
+]
+
+def run_batch(input_path, output_path):
+    print("Banking Content Compliance Review System - Batch Review")
+    print("------------------------------------------------------")
+    
+    items = load_batch_items(input_path)
+    print(f"\nLoaded {len(items)} items from {input_path}")
+    
+    # Review conversations go to disk rather than accumulating on the agents
+    transcript_path = f"{os.path.splitext(output_path)[0]}_transcript.jsonl"
+    with TranscriptLog(transcript_path) as transcript:
+        review_fn = create_review_fn(config_list, transcript)
+        batch = run_batch_review(items, review_fn)
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(batch, f, indent=2)
+    
+    report = batch["report"]
+    print("\nRun Report:")
+    print(f"Items: {report['items']}")
+    print(f"Distinct items reviewed: {report['distinct_items']}")
+    print(f"Duplicates skipped: {report['duplicates']}")
+    print(f"Dedupe ratio: {report['dedupe_ratio']:.1%}")
+    if report["reviews_failed"]:
+        print(f"Failed reviews: {report['reviews_failed']} (see 'review_error' in the results)")
+    
+    reviewer_stats = review_fn.pool_stats()["compliance_reviewer"]
+    print(f"Agent reuses: {reviewer_stats['reuses']} "
+          f"(construction time avoided: {reviewer_stats['construction_seconds_avoided']:.2f}s)")
+    print(f"\nResults written to {output_path}")
+    print(f"Review transcripts written to {transcript_path}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python batch.py <items.json|items.jsonl> [results.json]")
+        sys.exit(1)
+    run_batch(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "batch_results.json")
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script for Banking Content Compliance Review System
+This script measures the throughput of the word count and compliance rule hot paths over
+synthetic corpora and fails when throughput regresses against a stored baseline.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+
+from utils.word_count import count_words, validate_word_count, get_word_count_status, suggest_content_reduction
+from utils.compliance_rules import check_common_issues
+
+DEFAULT_BASELINE = os.path.join(".benchmarks", "baseline.json")
+
+# Fraction of baseline throughput that may be lost before a benchmark fails
+DEFAULT_THRESHOLD = 0.2
+
+# Minimum time each timed sample runs for, in seconds; small corpora are
+# processed repeatedly within a sample until it takes at least this long
+MIN_SAMPLE_SECONDS = 0.05
+
+# Timed samples per measurement, of which the median is reported
+SAMPLES = 5
+
+# Single documents, by word count
+DOCUMENT_SIZES = {
+    "banner_10": 10,
+    "paragraph_100": 100,
+    "page_1k": 1000,
+    "document_50k": 50000
+}
+
+# Batches of short items, by item count
+BATCH_SIZES = {
+    "batch_1k": 1000,
+    "batch_100k": 100000,
+    "batch_1m": 1000000
+}
+
+# Distinct item bodies a batch cycles through, as campaign exports repeat snippets
+BATCH_DISTINCT_ITEMS = 1000
+
+VOCABULARY = (
+    "save savings account instant access interest rate rates annual fixed term bonus "
+    "balance deposit withdraw withdrawals customers eligible terms conditions apply your "
+    "money with our the a and to for of on in from protected eligible deposits up to "
+    "capital financial services compensation scheme gross variable monthly easy open today"
+).split()
+
+PHRASES = ["best rates", "guarenteed growth", "best-ever rates", "no better home", "invest now"]
+
+def make_text(rng, word_count):
+    """
+    Generate synthetic copy with an occasional compliance phrase
+
+    Args:
+        rng (random.Random): Seeded random generator
+        word_count (int): Approximate number of words
+
+    Returns:
+        str: The synthetic text
+    """
+    words = []
+    while len(words) < word_count:
+        if rng.random() < 0.02:
+            words.extend(rng.choice(PHRASES).split())
+        else:
+            words.append(rng.choice(VOCABULARY))
+    return " ".join(words[:word_count])
+
+def build_corpora(max_batch):
+    """
+    Build the synthetic documents and batches
+
+    Args:
+        max_batch (int): Largest batch size to include
+
+    Returns:
+        dict: Corpus name mapped to (list of texts, total words)
+    """
+    rng = random.Random(42)
+    corpora = {}
+
+    for name, size in DOCUMENT_SIZES.items():
+        text = make_text(rng, size)
+        corpora[name] = ([text], size)
+
+    distinct = [make_text(rng, rng.randint(5, 40)) for _ in range(BATCH_DISTINCT_ITEMS)]
+    distinct_words = [count_words(text) for text in distinct]
+    for name, size in BATCH_SIZES.items():
+        if size > max_batch:
+            continue
+        texts = [distinct[i % BATCH_DISTINCT_ITEMS] for i in range(size)]
+        words = sum(distinct_words[i % BATCH_DISTINCT_ITEMS] for i in range(size))
+        corpora[name] = (texts, words)
+
+    return corpora
+
+BENCHMARKS = {
+    "count_words": count_words,
+    "validate_word_count": lambda text: validate_word_count(text, 50, 30),
+    "get_word_count_status": lambda text: get_word_count_status(text, 50, 30),
+    "suggest_content_reduction": lambda text: suggest_content_reduction(text, 30),
+    "check_common_issues": check_common_issues
+}
+
+def measure(func, texts, total_words):
+    """
+    Measure the throughput of a function over a corpus
+
+    Each sample processes the corpus enough times to take at least
+    MIN_SAMPLE_SECONDS, so timer resolution and one-off stalls do not
+    dominate tiny corpora. The median of SAMPLES samples is reported.
+
+    Args:
+        func (callable): The function to measure, called once per text
+        texts (list): The corpus
+        total_words (int): Words in the corpus
+
+    Returns:
+        dict: Items and words processed per second for the median sample
+    """
+    def run(repeats):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for text in texts:
+                func(text)
+        return time.perf_counter() - start
+
+    # Calibrate how many passes over the corpus one sample needs
+    repeats = 1
+    while run(repeats) < MIN_SAMPLE_SECONDS:
+        repeats *= 2
+
+    per_pass = statistics.median(run(repeats) / repeats for _ in range(SAMPLES))
+    per_pass = max(per_pass, 1e-9)
+    return {
+        "items_per_second": len(texts) / per_pass,
+        "words_per_second": total_words / per_pass
+    }
+
+def run_benchmarks(corpora, selected=None):
+    """
+    Run every benchmark over every corpus
+
+    Args:
+        corpora (dict): Output of build_corpora
+        selected (list, optional): Benchmark names to run, defaults to all
+
+    Returns:
+        dict: "<benchmark>/<corpus>" mapped to throughput results
+    """
+    results = {}
+    for bench_name, func in BENCHMARKS.items():
+        if selected and bench_name not in selected:
+            continue
+        for corpus_name, (texts, total_words) in corpora.items():
+            key = f"{bench_name}/{corpus_name}"
+            results[key] = measure(func, texts, total_words)
+            print(f"{key:<50} {results[key]['words_per_second']:>16,.0f} words/s")
+    return results
+
+def compare_to_baseline(results, baseline, threshold, remeasure=None):
+    """
+    Compare results against a baseline
+
+    A benchmark that looks like a regression is measured again before it is
+    reported, and the better of the two results counts.
+
+    Args:
+        results (dict): Output of run_benchmarks
+        baseline (dict): Previously saved results
+        threshold (float): Fraction of throughput that may be lost
+        remeasure (callable, optional): remeasure(key) returning a fresh result for a benchmark
+
+    Returns:
+        list: Descriptions of benchmarks that regressed
+    """
+    def change_for(before, result):
+        return (result["words_per_second"] - before) / before if before else 0.0
+
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["words_per_second"]
+        change = change_for(before, result)
+        if change < -threshold and remeasure:
+            retry = remeasure(key)
+            if change_for(before, retry) > change:
+                result = retry
+                change = change_for(before, result)
+        after = result["words_per_second"]
+        status = "✗" if change < -threshold else "✓"
+        print(f"{status} {key:<48} {change:>+8.1%}")
+        if change < -threshold:
+            regressions.append(f"{key}: {before:,.0f} -> {after:,.0f} words/s ({change:+.1%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the word count and compliance rule hot paths")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed throughput loss before failing, as a fraction (default: 0.2)")
+    parser.add_argument("--max-batch", type=int, default=max(BATCH_SIZES.values()),
+                        help="Largest batch size to run (default: 1000000)")
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="Exit 2 instead of 0 when there is no baseline to compare against")
+    args = parser.parse_args()
+
+    print("Banking Content Compliance Review System - Benchmarks")
+    print("----------------------------------------------------")
+    print(f"Python {platform.python_version()} on {platform.machine()}\n")
+
+    corpora = build_corpora(args.max_batch)
+    results = run_benchmarks(corpora, args.only)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}. Run with --save-baseline to create one.")
+        if args.require_baseline:
+            print("✗ Cannot gate on throughput without a baseline.")
+            return 2
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    print(f"\n=== Comparison with {args.baseline} (threshold {args.threshold:.0%}) ===")
+    def remeasure(key):
+        bench_name, corpus_name = key.split("/")
+        return measure(BENCHMARKS[bench_name], *corpora[corpus_name])
+
+    regressions = compare_to_baseline(results, baseline, args.threshold, remeasure)
+
+    if regressions:
+        print("\n✗ Throughput regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\n✓ No throughput regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
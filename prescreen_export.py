@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Prescreen Script for the Banking Content Compliance Review System
+This script runs the local word count and compliance checks over a large content export using all CPU cores.
+"""
+
+import json
+import time
+import argparse
+
+# Import our custom modules
+from utils.batch_review import iter_batch_items
+from utils.parallel_prescreen import parallel_prescreen, DEFAULT_CHUNK_SIZE
+
+def run_prescreen(input_path, output_path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    print("Banking Content Compliance Review System - Prescreen")
+    print("---------------------------------------------------")
+    
+    start = time.perf_counter()
+    count = 0
+    flagged = 0
+    
+    with open(output_path, "w", encoding="utf-8") as out:
+        for result in parallel_prescreen(iter_batch_items(input_path), workers=workers, chunk_size=chunk_size):
+            out.write(json.dumps(result) + "\n")
+            count += 1
+            if result["issues"] or not (result["desktop_valid"] and result["mobile_valid"]):
+                flagged += 1
+    
+    elapsed = time.perf_counter() - start
+    print(f"\nItems prescreened: {count}")
+    print(f"Items flagged: {flagged}")
+    print(f"Elapsed: {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} items/s)")
+    print(f"\nResults written to {output_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prescreen a JSON Lines content export")
+    parser.add_argument("input", help="Input .jsonl file with id, content and optional limits")
+    parser.add_argument("output", nargs="?", default="prescreen_results.jsonl", help="Output .jsonl file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Items per worker task")
+    args = parser.parse_args()
+    
+    run_prescreen(args.input, args.output, args.workers, args.chunk_size)
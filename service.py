@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Review Service for the Banking Content Compliance Review System
+This script exposes the prescreen and compliance review pipeline as a local HTTP service for the CMS.
+"""
+
+import os
+import asyncio
+import argparse
+import dotenv
+
+# Import our custom modules
+from utils.review_service import ReviewService, serve_reviews
+from utils.transcript import TranscriptLog
+
+def load_config_list():
+    """
+    Load the LLM configuration from env.local
+
+    Returns:
+        list: The config_list for the agents
+    """
+    dotenv.load_dotenv('env.local')
+
+    openai_api_key = os.environ.get("OPENAI_API_KEY")
+    if not openai_api_key or openai_api_key == "your_openai_api_key_here":
+        raise ValueError("Please set your OpenAI API key in env.local")
+
+    return [
+        {
+            "model": "gpt-4o-mini",
+            "api_key": openai_api_key
+        }
+    ]
+
+def run_service(args):
+    print("Banking Content Compliance Review System - Review Service")
+    print("--------------------------------------------------------")
+
+    review_fn = None
+    transcript = None
+    if not args.prescreen_only:
+        from agents.compliance_reviewer import create_review_fn
+        transcript = TranscriptLog(args.transcript)
+        # One pooled agent pair per worker so reviews never wait on each other
+        review_fn = create_review_fn(load_config_list(), transcript, pool_size=args.workers)
+
+    service = ReviewService(review_fn, workers=args.workers, queue_size=args.queue_size)
+
+    print(f"\nListening on http://{args.host}:{args.port} "
+          f"({args.workers} workers, queue size {args.queue_size}). Press Ctrl+C to stop.\n")
+    try:
+        asyncio.run(serve_reviews(service, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+    finally:
+        if transcript:
+            transcript.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve compliance reviews over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=2, help="Reviews processed concurrently")
+    parser.add_argument("--queue-size", type=int, default=100, help="Jobs that may wait before returning 429")
+    parser.add_argument("--transcript", default="service_transcript.jsonl", help="Review transcript log")
+    parser.add_argument("--prescreen-only", action="store_true", help="Run only the local checks, no LLM review")
+
+    run_service(parser.parse_args())
@@ -131,6 +131,540 @@ def test_compliance_rules():
     
     return True
 
+def test_fuzzy_compliance_rules():
+    """Test typo- and variant-tolerant compliance phrase detection"""
+    print("\nTesting fuzzy compliance rules functionality...")
+    
+    from utils.compliance_rules import check_common_issues
+    
+    variants = [
+        ("Guarenteed growth for every saver.", "guaranteed growth"),
+        ("Enjoy our best-ever rates.", "best rates"),
+        ("The highest-paying account around.", "highest paying"),
+        ("There's no better home for your savings.", "no better home"),
+        ("Watch money grow with us.", "Watch your money grow")
+    ]
+    
+    for content, expected in variants:
+        found = [issue['found'] for issue in check_common_issues(content)]
+        if expected in found:
+            print(f"✓ '{content}' matched '{expected}'")
+        else:
+            print(f"✗ '{content}' did not match '{expected}' (found: {found})")
+            return False
+    
+    # Near misses and required disclosures must not be flagged
+    clean = [
+        "The rest of the terms apply.",
+        "Test results show steady demand.",
+        "Guaranteed by the FSCS up to £85,000.",
+        "We invest in our community.",
+        "No further information is needed.",
+        "boest cfyw",
+        "Start earning interest from day one.",
+        "Watch your money carefully.",
+        "No FSCS fees.",
+        "No regulatory fees",
+        "No terms and conditions apply to this bonus.",
+        "There's no better time to save.",
+        "Best rated app"
+    ]
+    
+    for content in clean:
+        found = [issue['found'] for issue in check_common_issues(content)]
+        if found:
+            print(f"✗ '{content}' should not match (found: {found})")
+            return False
+    print(f"✓ {len(clean)} near misses not flagged")
+    
+    if check_common_issues("Guarenteed growth for every saver.", fuzzy=False):
+        print("✗ Exact matching should not tolerate typos")
+        return False
+    print("✓ Exact matching still available")
+    
+    return True
+
+def test_rule_packs():
+    """Test loading, caching and hot-reloading rule packs"""
+    print("\nTesting rule pack functionality...")
+    
+    import tempfile
+    from utils.compliance_rules import RULE_PACK_PATH, check_common_issues
+    from utils.rule_packs import RulePackManager
+    from utils.prescreen import prescreen_content
+    
+    with open(RULE_PACK_PATH, encoding="utf-8") as f:
+        pack = json.load(f)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pack_path = os.path.join(tmp_dir, "pack.json")
+        cache_dir = os.path.join(tmp_dir, "cache")
+        with open(pack_path, "w", encoding="utf-8") as f:
+            json.dump(pack, f)
+        
+        manager = RulePackManager(pack_path, cache_dir=cache_dir, check_interval=0)
+        if not os.listdir(cache_dir):
+            print("✗ Compiled rule pack was not cached")
+            return False
+        print(f"✓ Rule pack {manager.current()['label']} compiled and cached")
+        
+        pack["version"] = "test-reload"
+        pack["common_issues"]["absolute_claims"]["examples"].append("unbeatable")
+        with open(pack_path, "w", encoding="utf-8") as f:
+            json.dump(pack, f, indent=2)
+        
+        clean = prescreen_content("Competitive rates.", rule_pack=manager.current())
+        if clean["rule_pack_version"] != manager.current()["label"]:
+            print(f"✗ Clean prescreen result did not record the rule pack version (found: {clean})")
+            return False
+        print("✓ Clean prescreen result records the rule pack version")
+        
+        issues = check_common_issues("An unbeatable deal.", rule_pack=manager.current())
+        if issues and issues[0]["rule_pack_version"].endswith("@test-reload"):
+            print(f"✓ Rule pack hot-reloaded: {issues[0]['rule_pack_version']}")
+        else:
+            print(f"✗ Rule pack was not reloaded (found: {issues})")
+            return False
+    
+    return True
+
+def test_batch_dedupe():
+    """Test content-addressed deduplication in batch reviews"""
+    print("\nTesting batch deduplication functionality...")
+    
+    from utils.batch_review import run_batch_review
+    
+    items = [
+        {"id": "home", "content": "Earn competitive rates.", "desktop_limit": 5},
+        {"id": "app", "content": "earn  COMPETITIVE\nrates.", "mobile_limit": 2},
+        {"id": "email", "content": "Open an account today."}
+    ]
+    reviewed = []
+    
+    batch = run_batch_review(items, lambda content, prescreen: reviewed.append(content) or "review")
+    
+    if len(reviewed) == 2 and batch["report"]["duplicates"] == 1:
+        print(f"✓ Duplicates reviewed once (dedupe ratio: {batch['report']['dedupe_ratio']:.0%})")
+    else:
+        print(f"✗ Expected 2 reviews, got {len(reviewed)}")
+        return False
+    
+    app = batch["results"][1]
+    if any(not result.get("rule_pack_version") for result in batch["results"]):
+        print("✗ Batch result missing rule_pack_version")
+        return False
+    
+    if app["duplicate_of"] == "home" and app["review"] == "review" and not app["mobile_valid"]:
+        print("✓ Review fanned out with limits checked per item")
+    else:
+        print(f"✗ Duplicate result incorrect: {app}")
+        return False
+    
+    from utils.prescreen import build_review_message
+    messages = []
+    
+    def review_fn(content, prescreen):
+        messages.append(build_review_message(content, prescreen))
+        if "today" in content:
+            raise RuntimeError("reviewer unavailable")
+        return "review"
+    
+    batch = run_batch_review(items, review_fn)
+    if any("word limit" in message for message in messages):
+        print("✗ Shared review message should not state word limits")
+        return False
+    if batch["results"][2]["review_error"] != "reviewer unavailable" or batch["report"]["reviews_failed"] != 1:
+        print(f"✗ Failed review not recorded: {batch['results'][2]}")
+        return False
+    print("✓ Shared reviews omit limits and a failed review does not abort the batch")
+    
+    return True
+
+def test_parallel_prescreen():
+    """Test the process-pool prescreen"""
+    print("\nTesting parallel prescreen functionality...")
+    
+    from utils.parallel_prescreen import parallel_prescreen
+    
+    items = [
+        {"id": i, "content": "Guaranteed growth at the best rates." if i % 3 == 0 else "Competitive rates.", "mobile_limit": 4}
+        for i in range(50)
+    ]
+    
+    results = list(parallel_prescreen(items, workers=2, chunk_size=7, max_pending=2))
+    
+    if [result["id"] for result in results] == list(range(50)):
+        print("✓ Results streamed back in input order")
+    else:
+        print("✗ Results out of order")
+        return False
+    
+    flagged = [result["id"] for result in results if result["issues"]]
+    if flagged == list(range(0, 50, 3)) and not results[0]["mobile_valid"]:
+        print(f"✓ {len(flagged)} items flagged correctly")
+    else:
+        print(f"✗ Unexpected flagged items: {flagged}")
+        return False
+    
+    return True
+
+def test_speculative_revision():
+    """Test accepting and patching speculative revisions"""
+    print("\nTesting speculative revision functionality...")
+    
+    from agents.speculative_revision import run_speculative_revision
+    from utils.prescreen import prescreen_content
+    
+    content = "Guaranteed growth at the best rates."
+    prescreen = prescreen_content(content, 10, 5)
+    creator_calls = []
+    
+    def ask_creator(message):
+        creator_calls.append(message)
+        return "Competitive rates. Capital is not at risk. FSCS protected."
+    
+    result = run_speculative_revision(lambda message: "ACCEPT", ask_creator, content, prescreen)
+    if result["status"] == "accepted" and len(creator_calls) == 1:
+        print("✓ Speculative draft accepted without a patch round")
+    else:
+        print(f"✗ Expected acceptance, got {result['status']}")
+        return False
+    
+    result = run_speculative_revision(lambda message: "Missing FSCS limit", ask_creator, content, prescreen)
+    if result["status"] == "patched" and "Missing FSCS limit" in creator_calls[-1]:
+        print("✓ Speculative draft patched with remaining findings")
+    else:
+        print(f"✗ Expected a patch, got {result['status']}")
+        return False
+    
+    result = run_speculative_revision(lambda message: "Acceptable, but add the FSCS limit", ask_creator, content, prescreen)
+    if result["status"] != "patched":
+        print(f"✗ A qualified verdict should not accept the draft, got {result['status']}")
+        return False
+    print("✓ Qualified verdict treated as findings")
+    
+    result = run_speculative_revision(lambda message: "ACCEPT", lambda message: "The rest of our terms are available online.",
+                                      content, prescreen)
+    if result["status"] != "accepted":
+        print(f"✗ A near miss in the draft should not block acceptance, got {result['status']}")
+        return False
+    print("✓ Near miss in the draft did not block acceptance")
+    
+    return True
+
+def test_watch_manifest():
+    """Test change detection for watch mode"""
+    print("\nTesting watch mode change detection...")
+    
+    import tempfile
+    from utils.file_watch import HashManifest, scan_copy_files
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open(os.path.join(tmp_dir, "savings.txt"), "w") as f:
+            f.write("Competitive rates.")
+        os.makedirs(os.path.join(tmp_dir, ".compliance_watch"))
+        with open(os.path.join(tmp_dir, ".compliance_watch", "notes.txt"), "w") as f:
+            f.write("Not copy.")
+        
+        if list(scan_copy_files(tmp_dir)) != ["savings.txt"]:
+            print(f"✗ Unexpected copy files: {list(scan_copy_files(tmp_dir))}")
+            return False
+        print("✓ Hidden watcher state skipped")
+        
+        manifest_path = os.path.join(tmp_dir, ".compliance_watch", "manifest.json")
+        manifest = HashManifest(manifest_path)
+        manifest.record("savings.txt", "Competitive rates.")
+        manifest.save()
+        
+        reloaded = HashManifest(manifest_path)
+        if reloaded.needs_review("savings.txt", "competitive   RATES."):
+            print("✗ Whitespace and case changes should not trigger a review")
+            return False
+        if not reloaded.needs_review("savings.txt", "The best rates."):
+            print("✗ Content change was not detected")
+            return False
+        print("✓ Only normalized content changes trigger a review after restart")
+        
+        from watch import CopyReviewer
+        with open(os.path.join(tmp_dir, "isa.txt"), "w") as f:
+            f.write("Tax-free savings.")
+        CopyReviewer(tmp_dir).review_files(["isa.txt"])
+        
+        def failing_review(content, prescreen):
+            raise RuntimeError("reviewer unavailable")
+        
+        reviewer = CopyReviewer(tmp_dir, review_fn=failing_review)
+        reviewer.review_files(["isa.txt"])
+        if not HashManifest(reviewer.manifest.path).needs_review("isa.txt", "Tax-free savings."):
+            print("✗ A failed or prescreen-only review should leave the file due for LLM review")
+            return False
+        
+        reviewer = CopyReviewer(tmp_dir, review_fn=lambda content, prescreen: "review")
+        if not reviewer.review_file("isa.txt"):
+            print("✗ File was not sent for LLM review after a prescreen-only run")
+            return False
+        print("✓ Prescreen-only and failed reviews do not mark a file as reviewed")
+        
+        os.remove(os.path.join(tmp_dir, "isa.txt"))
+        reviewer.review_files(["isa.txt"])
+        if os.path.exists(os.path.join(tmp_dir, ".compliance_watch", "reviews", "isa.txt.json")):
+            print("✗ Review of a deleted file was left behind")
+            return False
+        print("✓ Deleted file's review removed")
+    
+    return True
+
+def test_transcript_log():
+    """Test bounded transcripts with spill-to-disk"""
+    print("\nTesting transcript log functionality...")
+    
+    import tempfile
+    from utils.transcript import TranscriptLog, archive_and_reset
+    
+    class FakeAgent:
+        def __init__(self):
+            self.chat_messages = {"peer": []}
+        
+        def reset(self):
+            self.chat_messages = {}
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with TranscriptLog(os.path.join(tmp_dir, "transcript.jsonl"), max_in_memory=5) as transcript:
+            agent = FakeAgent()
+            for review in range(10):
+                agent.chat_messages = {"peer": [
+                    {"role": "user", "content": f"Review {review}"},
+                    {"role": "assistant", "content": "Compliant"}
+                ]}
+                archive_and_reset(transcript, f"review-{review}", agent, [agent])
+            
+            if agent.chat_messages:
+                print("✗ Agent was not reset after the conversation")
+                return False
+            if len(transcript.recent()) != 5:
+                print(f"✗ Expected 5 messages in memory, got {len(transcript.recent())}")
+                return False
+            print("✓ Memory bounded and agents reset")
+            
+            first = list(transcript.iter_messages("review-0"))
+            if [message["content"] for message in first] == ["Review 0", "Compliant"]:
+                print("✓ Spilled messages read back from disk")
+            else:
+                print(f"✗ Unexpected spilled messages: {first}")
+                return False
+    
+    return True
+
+def test_agent_pool():
+    """Test pooled agent reuse"""
+    print("\nTesting agent pool functionality...")
+    
+    from agents.agent_pool import AgentPool
+    
+    class FakeAgent:
+        def __init__(self):
+            self.history = []
+        
+        def reset(self):
+            self.history = []
+    
+    built = []
+    pool = AgentPool(lambda config_list: built.append(1) or FakeAgent(), [{"model": "test"}], size=2)
+    
+    for review in range(10):
+        with pool.agent() as agent:
+            if agent.history:
+                print("✗ Pooled agent handed out with conversation history")
+                return False
+            agent.history.append(f"Review {review}")
+    
+    stats = pool.stats()
+    if len(built) == 2 and stats["reuses"] == 8:
+        print(f"✓ {stats['acquisitions']} reviews served by {stats['agents_built']} agents")
+    else:
+        print(f"✗ Unexpected pool usage: {stats}")
+        return False
+    
+    from agents.agent_pool import get_agent_pool
+    
+    def build_agent(config_list):
+        return FakeAgent()
+    
+    small = get_agent_pool(build_agent, [{"model": "pool-test"}], size=1)
+    large = get_agent_pool(build_agent, [{"model": "pool-test"}], size=3)
+    agents = [large.acquire() for _ in range(3)]
+    stats = large.stats()
+    if large is not small or stats["on_demand_builds"] != 2 or stats["wait_max_seconds"] > 0.1:
+        print(f"✗ Shared pool did not grow to the requested size: {stats}")
+        return False
+    for agent in agents:
+        large.release(agent)
+    print("✓ Shared pool grew on demand, with construction kept out of wait times")
+    
+    factories = [lambda config_list: FakeAgent(), lambda config_list: FakeAgent()]
+    if get_agent_pool(factories[0], [{"model": "pool-test"}]) is get_agent_pool(factories[1], [{"model": "pool-test"}]):
+        print("✗ Different factories with the same name shared a pool")
+        return False
+    print("✓ Each factory gets its own pool")
+    
+    return True
+
+def test_review_service():
+    """Test review service submission, idempotency and backpressure"""
+    print("\nTesting review service functionality...")
+    
+    from utils.review_service import ReviewService
+    
+    service = ReviewService(workers=1, queue_size=1)
+    
+    status, job, _ = service.handle("POST", "/reviews", b'{"content": "Best rates!", "mobile_limit": 10}')
+    if status != 202:
+        print(f"✗ Expected 202 for a new submission, got {status}")
+        return False
+    
+    status, again, _ = service.handle("POST", "/reviews", b'{"content": "best   RATES!", "mobile_limit": 10}')
+    if status == 200 and again["job_id"] == job["job_id"]:
+        print("✓ Resubmission returned the existing job")
+    else:
+        print(f"✗ Resubmission was not idempotent: {status}")
+        return False
+    
+    status, _, headers = service.handle("POST", "/reviews", b'{"content": "Competitive rates."}')
+    if status == 429 and "Retry-After" in headers:
+        print("✓ Full queue rejected with 429")
+    else:
+        print(f"✗ Expected 429 when the queue is full, got {status}")
+        return False
+    
+    status, _, _ = service.handle("GET", f"/reviews/{job['job_id']}/result", b"")
+    if status != 202:
+        print(f"✗ Expected 202 for a pending result, got {status}")
+        return False
+    print("✓ Pending result reported as 202")
+    
+    import asyncio
+    
+    def failing_review(content, prescreen):
+        raise RuntimeError("reviewer unavailable")
+    
+    async def run_failing_job():
+        failing = ReviewService(failing_review, workers=1, queue_size=1)
+        failing.start()
+        job, _ = failing.submit("Best rates!")
+        await failing.queue.join()
+        await failing.stop()
+        return failing, job
+    
+    failing, failed_job = asyncio.run(run_failing_job())
+    status, result, _ = failing.handle("GET", f"/reviews/{failed_job['job_id']}/result", b"")
+    if status != 200 or result["status"] != "failed" or result["error"] != "reviewer unavailable":
+        print(f"✗ Expected 200 with a failed status, got {status}: {result}")
+        return False
+    if failed_job["content"] is not None:
+        print("✗ Finished job still holds its content")
+        return False
+    print("✓ Failed result reported as 200 with status failed, content dropped")
+    
+    async def request_broken_handler():
+        broken = ReviewService(workers=1)
+        
+        def handle(method, path, body):
+            raise RuntimeError("boom")
+        
+        broken.handle = handle
+        server = await asyncio.start_server(broken.handle_connection, "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b"GET /stats HTTP/1.1\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+        return response
+    
+    response = asyncio.run(request_broken_handler())
+    if not response.startswith(b"HTTP/1.1 500") or b"Internal server error" not in response:
+        print(f"✗ Expected a 500 response from a failing handler, got {response[:60]}")
+        return False
+    print("✓ Handler errors answered with 500")
+    
+    return True
+
+def test_benchmark_gate():
+    """Test the benchmark regression gate"""
+    print("\nTesting benchmark regression gate...")
+    
+    from benchmark import compare_to_baseline
+    
+    baseline = {
+        "count_words/banner_10": {"words_per_second": 1000.0},
+        "count_words/page_1k": {"words_per_second": 1000.0}
+    }
+    results = {
+        "count_words/banner_10": {"words_per_second": 900.0},
+        "count_words/page_1k": {"words_per_second": 500.0},
+        "count_words/batch_1k": {"words_per_second": 10.0}
+    }
+    
+    regressions = compare_to_baseline(results, baseline, 0.2)
+    if len(regressions) != 1 or not regressions[0].startswith("count_words/page_1k"):
+        print(f"✗ Expected only page_1k to regress, got {regressions}")
+        return False
+    print("✓ Only drops beyond the threshold fail the gate")
+    
+    remeasured = []
+    
+    def remeasure(key):
+        remeasured.append(key)
+        return {"words_per_second": 950.0}
+    
+    regressions = compare_to_baseline(results, baseline, 0.2, remeasure)
+    if regressions or remeasured != ["count_words/page_1k"]:
+        print(f"✗ A noisy regression should be re-measured before failing: {regressions}")
+        return False
+    print("✓ Suspected regressions re-measured before failing")
+    
+    return True
+
+def test_streaming_word_count():
+    """Test streaming, markup-aware word counting"""
+    print("\nTesting streaming word count functionality...")
+    
+    import io
+    from utils.word_count import count_words_stream, validate_word_count
+    
+    html = ("<h1>Premium Saver</h1><script>var hidden = 1;</script>"
+            "<p>Earn <b>competitive</b> rates. See https://example.com/terms</p>"
+            "<h2>FSCS</h2><p>Your deposits are protected.</p>")
+    
+    # A tiny chunk size forces tags and words across chunk boundaries
+    result = count_words_stream(io.StringIO(html), chunk_size=5)
+    sections = [(section["heading"], section["word_count"]) for section in result["sections"]]
+    if result["word_count"] == 11 and sections == [("Premium Saver", 6), ("FSCS", 5)]:
+        print(f"✓ Markup skipped and sections counted: {sections}")
+    else:
+        print(f"✗ Unexpected streaming count: {result}")
+        return False
+    
+    inline = "<p>Rated <b>No.</b> # 1 savings account</p>\n# Terms\nApply."
+    for chunk_size in (3, 65536):
+        result = count_words_stream(io.StringIO(inline), chunk_size=chunk_size)
+        headings = [section["heading"] for section in result["sections"]]
+        if headings != [None, "Terms"]:
+            print(f"✗ Text after an inline tag treated as a line start: {result['sections']}")
+            return False
+    print("✓ '#' after an inline tag is not a heading")
+    
+    markdown = "# Savings\n\nEarn **competitive** rates. [Terms](https://example.com) apply.\n"
+    desktop_valid, mobile_valid, word_count = validate_word_count(
+        io.BytesIO(markdown.encode("utf-8")), 10, 5, strip_markup=True
+    )
+    if word_count == 6 and desktop_valid and not mobile_valid:
+        print(f"✓ Limits checked on a stream: {word_count} words")
+    else:
+        print(f"✗ Unexpected stream validation: {word_count} words")
+        return False
+    
+    return True
+
 def run_tests():
     """Run all tests"""
     print("Banking Content Compliance Review System - Setup Test")
@@ -140,7 +674,18 @@ def run_tests():
         ("Environment", test_environment),
         ("Imports", test_imports),
         ("Word Count", test_word_count),
-        ("Compliance Rules", test_compliance_rules)
+        ("Compliance Rules", test_compliance_rules),
+        ("Fuzzy Compliance Rules", test_fuzzy_compliance_rules),
+        ("Rule Packs", test_rule_packs),
+        ("Batch Dedupe", test_batch_dedupe),
+        ("Parallel Prescreen", test_parallel_prescreen),
+        ("Speculative Revision", test_speculative_revision),
+        ("Watch Manifest", test_watch_manifest),
+        ("Transcript Log", test_transcript_log),
+        ("Agent Pool", test_agent_pool),
+        ("Review Service", test_review_service),
+        ("Benchmark Gate", test_benchmark_gate),
+        ("Streaming Word Count", test_streaming_word_count)
     ]
     
     results = []
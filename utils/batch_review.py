@@ -0,0 +1,154 @@
+"""
+Batch Review Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module reviews batches of content items, reviewing each distinct body only once.
+"""
+
+import hashlib
+import json
+
+from utils.prescreen import prescreen_content
+from utils.word_count import get_limit_status
+
+def normalize_content(content):
+    """
+    Normalize content for duplicate detection
+
+    Whitespace runs collapse to a single space and case is ignored, so copies
+    of a snippet that differ only in layout or capitalisation compare equal.
+
+    Args:
+        content (str): The content to normalize
+
+    Returns:
+        str: The normalized content
+    """
+    return " ".join(content.split()).casefold()
+
+def content_hash(content):
+    """
+    Get the content address of a piece of content
+
+    Args:
+        content (str): The content to hash
+
+    Returns:
+        str: SHA-256 hex digest of the normalized content
+    """
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
+
+def iter_batch_items(path):
+    """
+    Read batch items from a JSON Lines file one at a time
+
+    Args:
+        path (str): Path to a .jsonl file
+
+    Yields:
+        dict: Each batch item
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield _check_item(json.loads(line))
+
+def load_batch_items(path):
+    """
+    Load batch items from a JSON list or a JSON Lines file
+
+    Each item needs "id" and "content", and may set "desktop_limit" and "mobile_limit".
+
+    Args:
+        path (str): Path to a .json or .jsonl file
+
+    Returns:
+        list: The batch items
+    """
+    if path.endswith(".jsonl"):
+        return list(iter_batch_items(path))
+
+    with open(path, encoding="utf-8") as f:
+        return [_check_item(item) for item in json.load(f)]
+
+def _check_item(item):
+    if "id" not in item or "content" not in item:
+        raise ValueError(f"Batch item is missing 'id' or 'content': {item}")
+    return item
+
+def run_batch_review(items, review_fn=None):
+    """
+    Review a batch of content items, deduplicating by content hash
+
+    Each distinct normalized body is prescreened and, if review_fn is given,
+    reviewed once; the result is shared by every item with that body. Word
+    count limits are still checked per item, since duplicates may appear on
+    channels with different limits, so the shared review is not told about
+    any limits. A review that raises is recorded as "review_error" on every
+    item with that body and the rest of the batch carries on.
+
+    Args:
+        items (list): Items with "id", "content" and optional "desktop_limit"/"mobile_limit"
+        review_fn (callable, optional): Called as review_fn(content, prescreen) for each
+            distinct body and returns the review
+
+    Returns:
+        dict: "results" in item order and a "report" with the dedupe ratio
+    """
+    distinct = {}
+    results = []
+
+    for item in items:
+        content = item["content"]
+        key = content_hash(content)
+
+        if key not in distinct:
+            prescreen = prescreen_content(content)
+            # Limits differ between duplicates, so the shared review sees none
+            shared_prescreen = {
+                "word_count": prescreen["word_count"],
+                "issues": prescreen["issues"],
+                "rule_pack_version": prescreen["rule_pack_version"]
+            }
+            review, review_error = None, None
+            if review_fn:
+                try:
+                    review = review_fn(content, shared_prescreen)
+                except Exception as e:
+                    review_error = str(e)
+                    print(f"Warning: review of item {item['id']} failed: {e}")
+            distinct[key] = dict(
+                shared_prescreen,
+                review=review,
+                review_error=review_error,
+                first_id=item["id"],
+                count=0
+            )
+        shared = distinct[key]
+        shared["count"] += 1
+
+        result = get_limit_status(shared["word_count"], item.get("desktop_limit"), item.get("mobile_limit"))
+        result.update({
+            "id": item["id"],
+            "content_hash": key,
+            "issues": shared["issues"],
+            "rule_pack_version": shared["rule_pack_version"],
+            "review": shared["review"],
+            "review_error": shared["review_error"],
+            "duplicate_of": shared["first_id"] if shared["count"] > 1 else None
+        })
+        results.append(result)
+
+    total = len(items)
+    unique = len(distinct)
+    failed = sum(1 for shared in distinct.values() if shared["review_error"])
+
+    return {
+        "results": results,
+        "report": {
+            "items": total,
+            "distinct_items": unique,
+            "duplicates": total - unique,
+            "dedupe_ratio": (total - unique) / total if total else 0.0,
+            "reviews_run": unique - failed if review_fn else 0,
+            "reviews_failed": failed
+        }
+    }
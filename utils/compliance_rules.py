@@ -3,6 +3,17 @@ Compliance Rules Utilities for Agent Brown Savings Banking Content Compliance Re
 This module provides utilities and definitions related to UK banking compliance rules.
 """
 
+import os
+
+from utils.rule_packs import RulePackManager, compile_rule_pack
+
+# Rule pack file loaded at runtime. The dictionaries below are a fallback for when
+# it is absent; the pack file is the source of truth and may have moved on from them.
+RULE_PACK_PATH = os.environ.get(
+    "RULE_PACK_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rules", "uk_fca.json")
+)
+
 # FCA Financial Promotion Rules (COBS 4)
 FCA_FINANCIAL_PROMOTION_RULES = {
     "clear_fair_not_misleading": {
@@ -51,7 +62,7 @@ FCA_FINANCIAL_PROMOTION_RULES = {
 COMMON_COMPLIANCE_ISSUES = {
     "absolute_claims": {
         "description": "Using absolute or unsubstantiated claims",
-        "examples": ["best rates", "highest returns", "guaranteed growth", "no better place"],
+        "examples": ["best rates", "highest returns", "guaranteed growth", "no better place", "highest paying", "no better home"],
         "fixes": [
             "Add qualifying language (e.g., 'one of the best', 'competitive rates')",
             "Provide evidence for claims (e.g., 'award-winning service since 2020')",
@@ -96,27 +107,80 @@ COMMON_COMPLIANCE_ISSUES = {
     }
 }
 
-def check_common_issues(content):
+_rule_pack_manager = None
+_builtin_rule_pack = None
+
+def get_rule_pack():
+    """
+    Get the active compiled rule pack
+    
+    The pack at RULE_PACK_PATH is loaded on first use and hot-reloaded when
+    the file changes. If no pack file exists, a warning is printed and the
+    built-in rules are used.
+    
+    Returns:
+        dict: The compiled rule pack
+    """
+    global _rule_pack_manager, _builtin_rule_pack
+    if _rule_pack_manager is None and os.path.exists(RULE_PACK_PATH):
+        _rule_pack_manager = RulePackManager(RULE_PACK_PATH)
+    if _rule_pack_manager is not None:
+        return _rule_pack_manager.current()
+    
+    if _builtin_rule_pack is None:
+        print(f"Warning: no rule pack at {RULE_PACK_PATH}, falling back to the built-in rules")
+        _builtin_rule_pack = compile_rule_pack({
+            "name": "builtin",
+            "version": "0",
+            "financial_promotion_rules": FCA_FINANCIAL_PROMOTION_RULES,
+            "common_issues": COMMON_COMPLIANCE_ISSUES
+        })
+    return _builtin_rule_pack
+
+def check_common_issues(content, fuzzy=True, rule_pack=None):
     """
     Check content for common compliance issues
     
     Args:
         content (str): The content to check
+        fuzzy (bool, optional): Tolerate typos, hyphenation and small wording
+            variants (e.g. "guarenteed", "best-ever rates"). When False, only
+            exact substrings of the examples are reported.
+        rule_pack (dict, optional): Compiled rule pack to check against.
+            Defaults to the active rule pack.
         
     Returns:
-        list: List of potential compliance issues found
+        list: List of potential compliance issues found, each recording the
+            rule pack version that produced it
     """
-    content_lower = content.lower()
+    rule_pack = rule_pack or get_rule_pack()
+    common_issues = rule_pack["issues"]
     issues = []
     
-    for issue_key, issue_data in COMMON_COMPLIANCE_ISSUES.items():
+    if fuzzy:
+        for match in rule_pack["phrase_index"].find(content):
+            issue_data = common_issues[match["type"]]
+            issues.append({
+                "type": match["type"],
+                "description": issue_data["description"],
+                "found": match["found"],
+                "matched": match["matched"],
+                "fixes": issue_data["fixes"],
+                "rule_pack_version": rule_pack["label"]
+            })
+        return issues
+    
+    content_lower = content.lower()
+    
+    for issue_key, issue_data in common_issues.items():
         for example in issue_data["examples"]:
             if example.lower() in content_lower:
                 issues.append({
                     "type": issue_key,
                     "description": issue_data["description"],
                     "found": example,
-                    "fixes": issue_data["fixes"]
+                    "fixes": issue_data["fixes"],
+                    "rule_pack_version": rule_pack["label"]
                 })
                 break
     
@@ -132,7 +196,7 @@ def get_compliance_rule_details(rule_key):
     Returns:
         dict: Details of the compliance rule
     """
-    return FCA_FINANCIAL_PROMOTION_RULES.get(rule_key, {})
+    return get_rule_pack()["rules"].get(rule_key, {})
 
 def get_all_compliance_rules():
     """
@@ -141,4 +205,4 @@ def get_all_compliance_rules():
     Returns:
         dict: All compliance rules
     """
-    return FCA_FINANCIAL_PROMOTION_RULES
+    return get_rule_pack()["rules"]
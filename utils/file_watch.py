@@ -0,0 +1,199 @@
+"""
+File Watch Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module watches a directory of copy files and tracks which file contents have been reviewed.
+"""
+
+import json
+import os
+import time
+
+from utils.batch_review import content_hash
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+# File types treated as copy
+DEFAULT_EXTENSIONS = (".txt", ".md", ".html", ".htm")
+
+def is_copy_file(path, extensions=DEFAULT_EXTENSIONS):
+    """
+    Check whether a path is a copy file to review
+
+    Hidden files and anything inside hidden directories are skipped, which
+    keeps the watcher's own manifest and review output out of the way.
+
+    Args:
+        path (str): Path relative to the watched directory
+        extensions (tuple, optional): File extensions to include
+
+    Returns:
+        bool: True if the file should be reviewed
+    """
+    parts = path.replace(os.sep, "/").split("/")
+    if any(part.startswith(".") for part in parts):
+        return False
+    return path.lower().endswith(extensions)
+
+def scan_copy_files(directory, extensions=DEFAULT_EXTENSIONS):
+    """
+    List the copy files under a directory with their modification stamps
+
+    Args:
+        directory (str): The directory to scan
+        extensions (tuple, optional): File extensions to include
+
+    Returns:
+        dict: Relative path mapped to (mtime_ns, size)
+    """
+    files = {}
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [name for name in dirs if not name.startswith(".")]
+        for name in names:
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, directory)
+            if not is_copy_file(relative, extensions):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files[relative] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+class HashManifest:
+    """
+    Persistent record of the normalized content hash last reviewed for each file
+    """
+
+    def __init__(self, path):
+        """
+        Load the manifest, starting empty if it does not exist yet
+
+        Args:
+            path (str): Path to the manifest JSON file
+        """
+        self.path = path
+        self.hashes = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.hashes = json.load(f)
+
+    def needs_review(self, relative, content):
+        """
+        Check whether a file's normalized content differs from what was last reviewed
+
+        Args:
+            relative (str): Path relative to the watched directory
+            content (str): The file's current content
+
+        Returns:
+            bool: True if the content has not been reviewed yet
+        """
+        return self.hashes.get(relative) != content_hash(content)
+
+    def record(self, relative, content):
+        """Record that a file's current content has been reviewed"""
+        self.hashes[relative] = content_hash(content)
+
+    def forget(self, relative):
+        """Remove a deleted file from the manifest"""
+        self.hashes.pop(relative, None)
+
+    def save(self):
+        """Write the manifest atomically"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.hashes, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+class DirectoryWatcher:
+    """
+    Reports batches of changed copy files, using inotify where available and polling otherwise
+
+    Changes are debounced: a batch is only reported once no further changes
+    have been seen for the debounce period, so a burst of saves from an
+    editor triggers a single review.
+    """
+
+    def __init__(self, directory, debounce=1.0, poll_interval=1.0, extensions=DEFAULT_EXTENSIONS, use_inotify=True):
+        """
+        Start watching a directory
+
+        Args:
+            directory (str): The directory to watch
+            debounce (float, optional): Quiet seconds required before reporting changes
+            poll_interval (float, optional): Seconds between scans when polling
+            extensions (tuple, optional): File extensions to include
+            use_inotify (bool, optional): Use inotify if inotify_simple is installed
+        """
+        self.directory = directory
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.extensions = extensions
+        self._files = scan_copy_files(directory, extensions)
+        self._inotify = None
+        self._watch_dirs = {}
+
+        if use_inotify and INotify is not None:
+            self._inotify = INotify()
+            for root, dirs, _ in os.walk(directory):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                self._add_watch(root)
+
+    @property
+    def mode(self):
+        """Return "inotify" or "polling" depending on how changes are detected"""
+        return "inotify" if self._inotify else "polling"
+
+    def _add_watch(self, path):
+        mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM | flags.CREATE | flags.DELETE
+        self._watch_dirs[self._inotify.add_watch(path, mask)] = path
+
+    def _changes_since_last_scan(self):
+        files = scan_copy_files(self.directory, self.extensions)
+        changed = {path for path, stamp in files.items() if self._files.get(path) != stamp}
+        changed.update(path for path in self._files if path not in files)
+        self._files = files
+        return changed
+
+    def _read_inotify(self, timeout):
+        changed = set()
+        for event in self._inotify.read(timeout=int(timeout * 1000)):
+            parent = self._watch_dirs.get(event.wd)
+            if parent is None or not event.name:
+                continue
+            path = os.path.join(parent, event.name)
+            if event.mask & flags.ISDIR:
+                if event.mask & (flags.CREATE | flags.MOVED_TO) and not event.name.startswith("."):
+                    self._add_watch(path)
+                continue
+            relative = os.path.relpath(path, self.directory)
+            if is_copy_file(relative, self.extensions):
+                changed.add(relative)
+        return changed
+
+    def _wait(self, timeout):
+        if self._inotify:
+            return self._read_inotify(timeout)
+        time.sleep(timeout)
+        return self._changes_since_last_scan()
+
+    def wait_for_changes(self):
+        """
+        Block until copy files change, then return them once edits settle
+
+        Returns:
+            set: Paths, relative to the watched directory, that were changed, created or deleted
+        """
+        changed = set()
+        while not changed:
+            changed = self._wait(self.poll_interval)
+
+        while True:
+            more = self._wait(self.debounce)
+            if not more:
+                return changed
+            changed.update(more)
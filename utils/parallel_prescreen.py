@@ -0,0 +1,86 @@
+"""
+Parallel Prescreen Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module prescreens large content exports across a pool of worker processes.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+
+from utils.compliance_rules import get_rule_pack
+from utils.prescreen import prescreen_content
+
+# Items sent to a worker per task; large enough to amortise inter-process overhead
+DEFAULT_CHUNK_SIZE = 256
+
+# Compiled rule pack inherited by each worker process
+_worker_rule_pack = None
+
+def _init_worker(rule_pack):
+    global _worker_rule_pack
+    _worker_rule_pack = rule_pack
+
+def _prescreen_item(item, rule_pack):
+    result = prescreen_content(
+        item["content"],
+        item.get("desktop_limit"),
+        item.get("mobile_limit"),
+        rule_pack=rule_pack
+    )
+    result["id"] = item["id"]
+    return result
+
+def _prescreen_chunk(chunk):
+    return [_prescreen_item(item, _worker_rule_pack) for item in chunk]
+
+def _chunks(items, chunk_size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _pool_context():
+    # Fork lets workers share the parent's compiled rule pack copy-on-write
+    # instead of unpickling their own; fall back where fork is unavailable.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def parallel_prescreen(items, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, rule_pack=None):
+    """
+    Prescreen items across a process pool, yielding results in input order
+
+    Items are read lazily and sharded into chunks. At most max_pending chunks
+    are in flight at once, so memory stays bounded however large the input.
+
+    Args:
+        items (iterable): Items with "id", "content" and optional "desktop_limit"/"mobile_limit"
+        workers (int, optional): Number of worker processes, defaults to the CPU count
+        chunk_size (int, optional): Items per task sent to a worker
+        max_pending (int, optional): Maximum chunks in flight, defaults to twice the workers
+        rule_pack (dict, optional): Compiled rule pack, defaults to the active rule pack
+
+    Yields:
+        dict: Prescreen result for each item, with its "id"
+    """
+    rule_pack = rule_pack or get_rule_pack()
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    if workers == 1:
+        for item in items:
+            yield _prescreen_item(item, rule_pack)
+        return
+
+    with _pool_context().Pool(workers, initializer=_init_worker, initargs=(rule_pack,)) as pool:
+        pending = deque()
+        for chunk in _chunks(items, chunk_size):
+            if len(pending) >= max_pending:
+                yield from pending.popleft().get()
+            pending.append(pool.apply_async(_prescreen_chunk, (chunk,)))
+        while pending:
+            yield from pending.popleft().get()
@@ -0,0 +1,270 @@
+"""
+Phrase Index Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module provides typo- and variant-tolerant phrase detection backed by an n-gram index.
+"""
+
+import re
+
+# Characters removed outright so that "there's" and "theres" normalize the same way
+_APOSTROPHES = re.compile(r"['‘’`]")
+
+# Everything that is not a letter or digit (hyphens, punctuation, symbols) splits tokens
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Size of the character n-grams used to find fuzzy candidates for a token
+NGRAM_SIZE = 3
+
+# Upper bound on the per-token cache so very large corpora cannot grow it forever
+TOKEN_CACHE_LIMIT = 100000
+
+def normalize_tokens(text):
+    """
+    Normalize text into lowercase word tokens
+
+    Hyphens and punctuation become token boundaries, so "best-ever rates"
+    yields ["best", "ever", "rates"].
+
+    Args:
+        text (str): The text to normalize
+
+    Returns:
+        list: Normalized word tokens
+    """
+    if not text:
+        return []
+    return _TOKEN.findall(_APOSTROPHES.sub("", text.lower()))
+
+def char_edit_budget(word):
+    """
+    Get the number of character edits tolerated for a phrase word
+
+    Short words are one edit away from too many others ("rates" and "rated",
+    "best" and "rest"), so they must match exactly.
+
+    Args:
+        word (str): The phrase word
+
+    Returns:
+        int: Maximum character edit distance for a fuzzy match
+    """
+    if len(word) <= 5:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+def within_edit_distance(a, b, max_distance):
+    """
+    Check whether two strings are within a bounded Levenshtein distance
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        max_distance (int): Maximum number of edits allowed
+
+    Returns:
+        bool: True if the edit distance is at most max_distance
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            current.append(cost)
+            if cost < row_min:
+                row_min = cost
+        # Every later row is at least as large as this row's minimum
+        if row_min > max_distance:
+            return False
+        previous = current
+
+    return previous[-1] <= max_distance
+
+def _ngrams(word):
+    """Return the set of padded character n-grams for a word"""
+    padded = f"^{word}$"
+    return {padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+class PhraseIndex:
+    """
+    N-gram index over compliance example phrases
+
+    Phrases are matched on word boundaries after normalization. Each phrase
+    word may differ from the content word by a small number of character
+    edits, and the phrase as a whole may differ by up to max_word_edits
+    inserted words or missing inner words. The first and last words of a
+    phrase must always match, as they carry its meaning ("No FSCS fees" is
+    not "No FSCS information"). Words are never substituted: wording
+    variants such as "highest paying" need their own example.
+    """
+
+    def __init__(self, issues, max_word_edits=1):
+        """
+        Build the index
+
+        Args:
+            issues (dict): Issue definitions keyed by issue type, each with an "examples" list
+            max_word_edits (int): Maximum word-level edits allowed per phrase
+        """
+        self.max_word_edits = max_word_edits
+        self.phrases = []
+        self.anchors = {}
+        self.vocabulary = set()
+
+        for issue_key, issue_data in issues.items():
+            for example in issue_data.get("examples", []):
+                tokens = tuple(normalize_tokens(example))
+                if not tokens:
+                    continue
+                phrase_id = len(self.phrases)
+                self.phrases.append((issue_key, example, tokens))
+                self.anchors.setdefault(tokens[0], []).append(phrase_id)
+                self.vocabulary.update(tokens)
+
+        # Character n-gram index over every phrase word. A word within k edits
+        # of a phrase word shares at least len(ngrams) - NGRAM_SIZE * k of its
+        # n-grams, so words whose bound drops to zero are always checked.
+        self.ngram_index = {}
+        self.min_shared = {}
+        self.unfiltered = []
+        for word in self.vocabulary:
+            grams = _ngrams(word)
+            self.min_shared[word] = len(grams) - NGRAM_SIZE * char_edit_budget(word)
+            if self.min_shared[word] <= 0:
+                self.unfiltered.append(word)
+            for gram in grams:
+                self.ngram_index.setdefault(gram, []).append(word)
+
+        self._token_cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_token_cache"] = {}
+        return state
+
+    def matching_words(self, token):
+        """
+        Get the phrase words that a content token fuzzily matches
+
+        Args:
+            token (str): A normalized content token
+
+        Returns:
+            tuple: Phrase words within their edit budget of the token, sorted
+        """
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        shared = {}
+        for gram in _ngrams(token):
+            for word in self.ngram_index.get(gram, ()):
+                shared[word] = shared.get(word, 0) + 1
+
+        candidates = [word for word, count in shared.items() if count >= self.min_shared[word]]
+        candidates.extend(word for word in self.unfiltered if word not in shared)
+
+        matches = tuple(sorted(
+            word for word in candidates
+            if within_edit_distance(word, token, char_edit_budget(word))
+        ))
+
+        if len(self._token_cache) >= TOKEN_CACHE_LIMIT:
+            self._token_cache.clear()
+        self._token_cache[token] = matches
+        return matches
+
+    def _match_at(self, phrase_tokens, tokens, start):
+        """
+        Align a phrase against content starting at an anchored position
+
+        Args:
+            phrase_tokens (tuple): Normalized phrase tokens
+            tokens (list): Normalized content tokens
+            start (int): Index of the content token matching the phrase anchor
+
+        Returns:
+            int: End index (exclusive) of the best match, or -1 if none
+        """
+        rest = phrase_tokens[1:]
+        if not rest:
+            return start + 1
+
+        budget = self.max_word_edits
+        window = tokens[start + 1:start + 1 + len(rest) + budget]
+        # Substituting a word, or dropping the last one, lets the rest of the
+        # phrase match almost anything
+        forbidden = budget + 1
+
+        # Semi-global alignment: the phrase must be consumed, the window need not be
+        previous = list(range(len(window) + 1))
+        for i, word in enumerate(rest, 1):
+            # Only inner words may be missing
+            skip_cost = 1 if i < len(rest) else forbidden
+            current = [previous[0] + skip_cost]
+            for j, token in enumerate(window, 1):
+                same = word in self.matching_words(token)
+                current.append(min(
+                    previous[j] + skip_cost,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (0 if same else forbidden)
+                ))
+            if min(current) > budget:
+                return -1
+            previous = current
+
+        best_end, best_cost = -1, budget + 1
+        for j, cost in enumerate(previous):
+            # Prefer the cheapest alignment, and the longest span among equals
+            if cost <= best_cost:
+                best_end, best_cost = j, cost
+        if best_end < 0:
+            return -1
+        return start + 1 + best_end
+
+    def find(self, content, first_per_issue=True):
+        """
+        Find compliance example phrases in content
+
+        Args:
+            content (str): The content to search
+            first_per_issue (bool): Stop looking for an issue type once it has matched
+
+        Returns:
+            list: Matches as dicts with "phrase_id", "type", "found" (the example)
+                and "matched" (the normalized content text)
+        """
+        tokens = normalize_tokens(content)
+        matches = []
+        found_types = set()
+
+        for start, token in enumerate(tokens):
+            for anchor in self.matching_words(token):
+                for phrase_id in self.anchors.get(anchor, ()):
+                    issue_key, example, phrase_tokens = self.phrases[phrase_id]
+                    if first_per_issue and issue_key in found_types:
+                        continue
+                    end = self._match_at(phrase_tokens, tokens, start)
+                    if end < 0:
+                        continue
+                    found_types.add(issue_key)
+                    matches.append({
+                        "phrase_id": phrase_id,
+                        "type": issue_key,
+                        "found": example,
+                        "matched": " ".join(tokens[start:end])
+                    })
+
+        # Report in rule order rather than content order
+        matches.sort(key=lambda match: match["phrase_id"])
+        return matches
@@ -0,0 +1,76 @@
+"""
+Prescreen Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module runs the local word count and compliance checks that precede an LLM review.
+"""
+
+from utils.word_count import get_word_count_status
+from utils.compliance_rules import check_common_issues, get_rule_pack
+
+def prescreen_content(content, desktop_limit=None, mobile_limit=None, rule_pack=None):
+    """
+    Run the local checks for a piece of content
+
+    Args:
+        content (str): The content to check
+        desktop_limit (int, optional): Maximum word count for desktop
+        mobile_limit (int, optional): Maximum word count for mobile
+        rule_pack (dict, optional): Compiled rule pack to check against
+
+    Returns:
+        dict: Word count status, the list of potential compliance issues and
+            the version of the rule pack they were checked against
+    """
+    # Resolve the pack once so the issues and the reported version always agree
+    rule_pack = rule_pack or get_rule_pack()
+    result = get_word_count_status(content, desktop_limit, mobile_limit)
+    result["issues"] = check_common_issues(content, rule_pack=rule_pack)
+    result["rule_pack_version"] = rule_pack["label"]
+    return result
+
+def format_issues_text(issues):
+    """
+    Format prescreen issues for inclusion in a review message
+
+    Args:
+        issues (list): Issues from check_common_issues
+
+    Returns:
+        str: Issues section of the message, or an empty string if there are none
+    """
+    if not issues:
+        return ""
+
+    issues_text = "\n\nPotential compliance issues detected:\n"
+    for issue in issues:
+        issues_text += f"- {issue['description']} (found: '{issue['found']}')\n"
+    return issues_text
+
+def build_review_message(content, prescreen):
+    """
+    Build the message asking the Compliance Reviewer to review content
+
+    The word limit lines are left out when the prescreen carries no limits,
+    as for a review shared by items with different limits.
+
+    Args:
+        content (str): The content to review
+        prescreen (dict): Result of prescreen_content for the content
+
+    Returns:
+        str: The review request message
+    """
+    limits_text = ""
+    if "desktop_limit" in prescreen:
+        desktop_limit = prescreen["desktop_limit"]
+        mobile_limit = prescreen["mobile_limit"]
+        limits_text = f"""
+    Desktop word limit: {desktop_limit if desktop_limit else 'No limit'} (Status: {'OK' if prescreen['desktop_valid'] else 'Exceeds limit'})
+    Mobile word limit: {mobile_limit if mobile_limit else 'No limit'} (Status: {'OK' if prescreen['mobile_valid'] else 'Exceeds limit'})"""
+
+    return f"""I need to review content for our Agent Brown Savings customers. Here's the draft:
+
+    "{content}"
+
+    Current word count: {prescreen['word_count']} words{limits_text}
+    {format_issues_text(prescreen['issues'])}
+    Please review this for compliance with UK banking regulations and provide feedback."""
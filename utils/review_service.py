@@ -0,0 +1,335 @@
+"""
+Review Service Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module serves the prescreen and compliance review pipeline over a local async HTTP API
+with a bounded job queue.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.batch_review import content_hash
+from utils.compliance_rules import get_rule_pack
+from utils.prescreen import prescreen_content
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+# Finished jobs kept for status and result lookups before the oldest are dropped
+MAX_FINISHED_JOBS = 10000
+
+# Number of recent job latencies kept for percentile reporting
+LATENCY_SAMPLES = 1000
+
+# Seconds between checks for an edited rule pack, made off the event loop
+RULE_PACK_REFRESH_SECONDS = 2.0
+
+HTTP_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error"
+}
+
+def job_id_for(content, desktop_limit=None, mobile_limit=None, rule_pack_label=None):
+    """
+    Get the job id for a review request
+
+    Resubmitting the same normalized content with the same limits against the
+    same rule pack yields the same id, which makes submission idempotent. Once
+    the rule pack changes, the same request gets a new job.
+
+    Args:
+        content (str): The content to review
+        desktop_limit (int, optional): Maximum word count for desktop
+        mobile_limit (int, optional): Maximum word count for mobile
+        rule_pack_label (str, optional): Label of the rule pack the review runs against
+
+    Returns:
+        str: The job id
+    """
+    key = f"{content_hash(content)}:{desktop_limit}:{mobile_limit}:{rule_pack_label}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+class ReviewService:
+    """
+    Bounded job queue feeding a fixed number of review workers
+    """
+
+    def __init__(self, review_fn=None, workers=2, queue_size=100):
+        """
+        Set up the service
+
+        Args:
+            review_fn (callable, optional): review_fn(content, prescreen) returning the LLM review;
+                when omitted only the prescreen runs
+            workers (int, optional): Reviews processed concurrently
+            queue_size (int, optional): Jobs that may wait before submissions are rejected
+        """
+        self.review_fn = review_fn
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs = OrderedDict()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.counts = {"submitted": 0, "deduplicated": 0, "rejected": 0, "completed": 0, "failed": 0}
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._tasks = []
+        # Loaded here and then refreshed in a thread, as a reload compiles the
+        # pack and would block every connection if done on the event loop
+        self.rule_pack = get_rule_pack()
+
+    def start(self):
+        """Start the worker tasks on the running event loop"""
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._refresh_rule_pack()))
+
+    async def _refresh_rule_pack(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(RULE_PACK_REFRESH_SECONDS)
+            self.rule_pack = await loop.run_in_executor(None, get_rule_pack)
+
+    async def stop(self):
+        """Cancel the workers and shut down the review threads"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=False)
+
+    def submit(self, content, desktop_limit=None, mobile_limit=None):
+        """
+        Queue a review, or return the existing job for the same request
+
+        Args:
+            content (str): The content to review
+            desktop_limit (int, optional): Maximum word count for desktop
+            mobile_limit (int, optional): Maximum word count for mobile
+
+        Returns:
+            tuple: (job, created) where job is None if the queue is full
+        """
+        rule_pack = self.rule_pack
+        job_id = job_id_for(content, desktop_limit, mobile_limit, rule_pack["label"])
+        existing = self.jobs.get(job_id)
+        if existing and existing["status"] != "failed":
+            self.counts["deduplicated"] += 1
+            return existing, False
+
+        job = {
+            "job_id": job_id,
+            "status": "queued",
+            "content": content,
+            "desktop_limit": desktop_limit,
+            "mobile_limit": mobile_limit,
+            "rule_pack": rule_pack,
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None
+        }
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.counts["rejected"] += 1
+            return None, False
+
+        self.jobs[job_id] = job
+        self.jobs.move_to_end(job_id)
+        self.counts["submitted"] += 1
+        self._evict_finished()
+        return job, True
+
+    def _evict_finished(self):
+        excess = len(self.jobs) - MAX_FINISHED_JOBS
+        for job_id in list(self.jobs):
+            if excess <= 0:
+                break
+            if self.jobs[job_id]["status"] in ("done", "failed"):
+                del self.jobs[job_id]
+                excess -= 1
+
+    def _review(self, job):
+        prescreen = prescreen_content(job["content"], job["desktop_limit"], job["mobile_limit"], job["rule_pack"])
+        result = dict(prescreen)
+        if self.review_fn:
+            result["review"] = self.review_fn(job["content"], prescreen)
+        return result
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            try:
+                job["result"] = await loop.run_in_executor(self._executor, self._review, job)
+                job["status"] = "done"
+                self.counts["completed"] += 1
+            except Exception as e:
+                job["error"] = str(e)
+                job["status"] = "failed"
+                self.counts["failed"] += 1
+            finally:
+                # Finished jobs are kept for lookups, but not the content or pack they were run with
+                job["content"] = None
+                job["rule_pack"] = None
+                job["finished_at"] = time.time()
+                self.latencies.append(job["finished_at"] - job["submitted_at"])
+                self.queue.task_done()
+
+    def status(self, job):
+        """Get the public status view of a job"""
+        return {key: job[key] for key in ("job_id", "status", "submitted_at", "started_at", "finished_at", "error")}
+
+    def stats(self):
+        """
+        Get queue and latency statistics
+
+        Returns:
+            dict: Queue depth, job counts and p50/p99 submit-to-finish latency in seconds
+        """
+        latencies = sorted(self.latencies)
+        return dict(
+            self.counts,
+            queue_depth=self.queue.qsize(),
+            queue_capacity=self.queue.maxsize,
+            workers=self.workers,
+            latency_p50_seconds=_percentile(latencies, 0.5),
+            latency_p99_seconds=_percentile(latencies, 0.99)
+        )
+
+    def handle(self, method, path, body):
+        """
+        Route an API request
+
+        Endpoints:
+            POST /reviews                  Submit content; 202 when queued, 200 if already known, 429 when full
+            GET  /reviews/<job_id>         Job status
+            GET  /reviews/<job_id>/result  Job result once done, or the error once failed
+            GET  /stats                    Queue and latency statistics
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path
+            body (bytes): Request body
+
+        Returns:
+            tuple: (status_code, response_dict, extra_headers)
+        """
+        parts = [part for part in path.split("?")[0].split("/") if part]
+
+        if parts == ["stats"]:
+            if method != "GET":
+                return 405, {"error": "Method not allowed"}, {}
+            return 200, self.stats(), {}
+
+        if parts == ["reviews"]:
+            if method != "POST":
+                return 405, {"error": "Method not allowed"}, {}
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "Body must be JSON"}, {}
+            content = request.get("content") if isinstance(request, dict) else None
+            if not isinstance(content, str) or not content.strip():
+                return 400, {"error": "'content' is required"}, {}
+
+            limits = [request.get("desktop_limit"), request.get("mobile_limit")]
+            if any(limit is not None and (not isinstance(limit, int) or isinstance(limit, bool)) for limit in limits):
+                return 400, {"error": "Word limits must be integers"}, {}
+
+            job, created = self.submit(content, *limits)
+            if job is None:
+                return 429, {"error": "Review queue is full, retry later"}, {"Retry-After": "1"}
+            return (202 if created else 200), self.status(job), {"Location": f"/reviews/{job['job_id']}"}
+
+        if len(parts) in (2, 3) and parts[0] == "reviews" and parts[2:] in ([], ["result"]):
+            if method != "GET":
+                return 405, {"error": "Method not allowed"}, {}
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return 404, {"error": "Unknown job"}, {}
+            if len(parts) == 2:
+                return 200, self.status(job), {}
+            if job["status"] in ("done", "failed"):
+                # A failed review is a finished job, not a server error; the body carries the error
+                return 200, dict(self.status(job), result=job["result"]), {}
+            return 202, self.status(job), {}
+
+        return 404, {"error": "Not found"}, {}
+
+    async def handle_connection(self, reader, writer):
+        """Serve one HTTP/1.1 request on a connection"""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if len(request_line) < 2:
+                status, payload, extra = 400, {"error": "Malformed request"}, {}
+            else:
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    status, payload, extra = 413, {"error": "Request body too large"}, {}
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status = None
+        except (ValueError, asyncio.IncompleteReadError):
+            status, payload, extra = 400, {"error": "Malformed request"}, {}
+
+        if status is None:
+            try:
+                status, payload, extra = self.handle(request_line[0].upper(), request_line[1], body)
+            except Exception as e:
+                print(f"Error handling {request_line[0]} {request_line[1]}: {e}")
+                status, payload, extra = 500, {"error": "Internal server error"}, {}
+
+        data = json.dumps(payload).encode("utf-8")
+        head = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(data)}",
+                "Connection: close"]
+        head.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            # The client went away; there is nobody left to answer
+            writer.close()
+
+async def serve_reviews(service, host="127.0.0.1", port=8080):
+    """
+    Run the review service until cancelled
+
+    Args:
+        service (ReviewService): The service to expose
+        host (str, optional): Interface to bind
+        port (int, optional): Port to listen on
+    """
+    service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
@@ -0,0 +1,217 @@
+"""
+Rule Pack Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module loads versioned compliance rule packs from JSON or YAML files, caches their
+compiled form on disk and hot-reloads them when the file changes.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+
+import utils.phrase_index
+from utils.phrase_index import PhraseIndex
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Bump when the compiled structures change shape so stale caches are ignored
+COMPILER_VERSION = 1
+
+def _phrase_index_version():
+    # The cache pickles PhraseIndex instances, so any change to the phrase index
+    # code must invalidate it, whether or not COMPILER_VERSION was bumped
+    with open(utils.phrase_index.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+PHRASE_INDEX_VERSION = _phrase_index_version()
+
+# Where compiled rule packs are persisted between processes
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".rule_cache")
+
+REQUIRED_KEYS = ("name", "version", "financial_promotion_rules", "common_issues")
+
+def parse_rule_pack(data, source="<memory>"):
+    """
+    Validate a rule pack definition
+
+    Args:
+        data (dict): The parsed rule pack
+        source (str): Where the pack came from, for error messages
+
+    Returns:
+        dict: The validated rule pack
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Rule pack {source} must be a mapping")
+
+    missing = [key for key in REQUIRED_KEYS if key not in data]
+    if missing:
+        raise ValueError(f"Rule pack {source} is missing: {', '.join(missing)}")
+
+    for issue_key, issue_data in data["common_issues"].items():
+        for key in ("description", "examples", "fixes"):
+            if key not in issue_data:
+                raise ValueError(f"Rule pack {source} issue '{issue_key}' is missing '{key}'")
+
+    data["version"] = str(data["version"])
+    return data
+
+def read_rule_pack(path):
+    """
+    Read a rule pack file
+
+    Args:
+        path (str): Path to a .json, .yaml or .yml rule pack
+
+    Returns:
+        tuple: (rule_pack, source_hash)
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ImportError("PyYAML is required for YAML rule packs. Please install it with: pip install pyyaml")
+        data = yaml.safe_load(raw)
+    else:
+        data = json.loads(raw.decode("utf-8"))
+
+    return parse_rule_pack(data, path), hashlib.sha256(raw).hexdigest()
+
+def compile_rule_pack(pack, source_hash=None):
+    """
+    Compile a rule pack into the structures used for matching
+
+    Args:
+        pack (dict): A validated rule pack
+        source_hash (str, optional): Hash of the file the pack was read from
+
+    Returns:
+        dict: Compiled rule pack with rules, issues, phrase index and version label
+    """
+    return {
+        "name": pack["name"],
+        "version": pack["version"],
+        "label": f"{pack['name']}@{pack['version']}",
+        "source_hash": source_hash,
+        "rules": pack["financial_promotion_rules"],
+        "issues": pack["common_issues"],
+        "phrase_index": PhraseIndex(pack["common_issues"])
+    }
+
+def _cache_path(cache_dir, source_hash):
+    return os.path.join(cache_dir, f"{source_hash}-v{COMPILER_VERSION}-{PHRASE_INDEX_VERSION}.pickle")
+
+def load_compiled_rule_pack(path, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load a rule pack, using the on-disk compiled cache when it is current
+
+    The cache is keyed by the hash of the pack file and the phrase index code,
+    so an edited pack or matcher is always recompiled. Cache files are written
+    atomically and a corrupt, unreadable or incompatible cache simply falls
+    back to compiling.
+
+    Args:
+        path (str): Path to the rule pack file
+        cache_dir (str, optional): Directory for compiled packs, or None to disable caching
+
+    Returns:
+        dict: The compiled rule pack
+    """
+    pack, source_hash = read_rule_pack(path)
+
+    if cache_dir:
+        cache_file = _cache_path(cache_dir, source_hash)
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Unpickling can raise almost anything for a stale cache, e.g. ImportError
+            pass
+
+    compiled = compile_rule_pack(pack, source_hash)
+
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: could not cache compiled rule pack: {e}")
+
+    return compiled
+
+class RulePackManager:
+    """
+    Holds the active compiled rule pack and hot-reloads it when the file changes
+
+    Callers should take one pack from current() and use it for a whole check,
+    so a reload mid-check never mixes two versions.
+    """
+
+    def __init__(self, path, cache_dir=DEFAULT_CACHE_DIR, check_interval=2.0):
+        """
+        Load the rule pack
+
+        Args:
+            path (str): Path to the rule pack file
+            cache_dir (str, optional): Directory for compiled packs, or None to disable caching
+            check_interval (float, optional): Minimum seconds between file change checks
+        """
+        self.path = path
+        self.cache_dir = cache_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stat = self._file_stat()
+        self._pack = load_compiled_rule_pack(path, cache_dir)
+        self._next_check = time.monotonic() + check_interval
+
+    def _file_stat(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def current(self):
+        """
+        Get the active compiled rule pack, reloading it first if the file changed
+
+        Returns:
+            dict: The compiled rule pack
+        """
+        if time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._pack
+
+    def reload_if_changed(self):
+        """
+        Reload the rule pack if its file has changed since it was loaded
+
+        A pack that fails to load is reported and the previous pack stays active.
+
+        Returns:
+            bool: True if a new pack was swapped in
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                stat = self._file_stat()
+                if stat == self._stat:
+                    return False
+                # Record the change up front so a broken file is reported once, not on every check
+                self._stat = stat
+                pack = load_compiled_rule_pack(self.path, self.cache_dir)
+            except Exception as e:
+                print(f"Warning: keeping rule pack {self._pack['label']}, reload failed: {e}")
+                return False
+
+            if pack["source_hash"] == self._pack["source_hash"]:
+                return False
+            # Single reference assignment: readers see the old or the new pack, never a mix
+            self._pack = pack
+            return True
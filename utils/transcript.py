@@ -0,0 +1,132 @@
+"""
+Transcript Utilities for Agent Brown Savings Banking Content Compliance Review System
+This module keeps conversation transcripts in a bounded in-memory ring backed by an
+append-only log on disk, so long-running workers do not accumulate message history.
+"""
+
+import json
+import threading
+from collections import deque
+
+# Number of recent messages kept in memory
+DEFAULT_MAX_IN_MEMORY = 200
+
+class TranscriptLog:
+    """
+    Bounded in-memory transcript with an append-only JSON Lines log on disk
+
+    Every message is written to the log; only the most recent max_in_memory
+    messages are also kept in memory. Older messages are read back lazily
+    from the log with iter_messages().
+    """
+
+    def __init__(self, path, max_in_memory=DEFAULT_MAX_IN_MEMORY):
+        """
+        Open the transcript log for appending
+
+        Args:
+            path (str): Path to the JSON Lines log file
+            max_in_memory (int, optional): Number of recent messages kept in memory
+        """
+        self.path = path
+        self._recent = deque(maxlen=max_in_memory)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.message_count = 0
+
+    def append(self, conversation_id, message):
+        """
+        Record a message
+
+        Args:
+            conversation_id (str): The conversation the message belongs to
+            message (dict): The message, e.g. with "role", "name" and "content"
+        """
+        with self._lock:
+            self._write(conversation_id, message)
+
+    def _write(self, conversation_id, message):
+        # Callers hold self._lock
+        entry = dict(message, conversation=conversation_id)
+        self._file.write(json.dumps(entry, default=str) + "\n")
+        self._recent.append(entry)
+        self.message_count += 1
+
+    def record_conversation(self, conversation_id, messages):
+        """
+        Record every message of a finished conversation
+
+        Args:
+            conversation_id (str): The conversation the messages belong to
+            messages (list): The messages in order
+        """
+        # Hold the lock so concurrent conversations are not interleaved in the log
+        with self._lock:
+            for message in messages:
+                self._write(conversation_id, message)
+            self._file.flush()
+
+    def recent(self):
+        """
+        Get the messages still held in memory
+
+        Returns:
+            list: The most recent messages, oldest first
+        """
+        return list(self._recent)
+
+    def iter_messages(self, conversation_id=None):
+        """
+        Read messages back from the log lazily
+
+        Args:
+            conversation_id (str, optional): Only yield messages from this conversation
+
+        Yields:
+            dict: Each logged message, oldest first
+        """
+        with self._lock:
+            self._file.flush()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if conversation_id is None or entry["conversation"] == conversation_id:
+                    yield entry
+
+    def close(self):
+        """Flush and close the log"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def archive_and_reset(transcript, conversation_id, initiator, agents, groupchat=None):
+    """
+    Move a finished conversation out of the agents and into a transcript log
+
+    The full transcript is taken from the group chat if there is one, otherwise
+    from the initiating agent's side of each of its chats (the other side holds
+    the same messages). All agents and the group chat are then reset, so the
+    next conversation starts with empty history.
+
+    Args:
+        transcript (TranscriptLog): Log to record the conversation in, or None to only reset
+        conversation_id (str): Identifier for the conversation
+        initiator: The agent that started the conversation
+        agents (list): Every agent that took part, including the initiator
+        groupchat (GroupChat, optional): The group chat used for the conversation
+    """
+    if transcript is not None:
+        if groupchat is not None:
+            transcript.record_conversation(conversation_id, groupchat.messages)
+        else:
+            for messages in initiator.chat_messages.values():
+                transcript.record_conversation(conversation_id, messages)
+
+    if groupchat is not None:
+        groupchat.reset()
+    for agent in agents:
+        agent.reset()
@@ -3,6 +3,34 @@ Word Count Utilities for Agent Brown Savings Banking Content Compliance Review S
 This module provides utilities for word count validation and processing.
 """
 
+import codecs
+import mmap
+import re
+
+# Bytes or characters read per step when counting a file
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest line held back while waiting for its end before it is split at whitespace
+MAX_CARRY = 1024 * 1024
+
+# Words kept from a heading to name its section
+MAX_HEADING_WORDS = 12
+
+# Start of an HTML tag, comment or declaration
+_MARKUP_START = re.compile(r"<(!--|/?[A-Za-z][A-Za-z0-9]*|![A-Za-z]|\?)")
+
+# HTML elements whose content is never copy
+_SKIPPED_ELEMENTS = ("script", "style")
+
+_HTML_HEADING = re.compile(r"h[1-6]")
+_MARKDOWN_HEADING = re.compile(r"\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_URL = re.compile(r"(?:https?://|www\.)\S+", re.IGNORECASE)
+_ENTITY = re.compile(r"&(?:#\d+|#x[0-9A-Fa-f]+|[A-Za-z]+);")
+
+# A word must contain a letter or digit, so bare Markdown syntax like "#", "-" or "|" is skipped
+_WORD = re.compile(r"\S*?[^\W_]\S*")
+
 def count_words(text):
     """
     Count the number of words in a text
@@ -16,42 +44,259 @@ def count_words(text):
     if not text:
         return 0
     
-    # Split by whitespace and count non-empty words
-    words = [word for word in text.split() if word.strip()]
-    return len(words)
+    # split() with no separator never yields empty or whitespace-only words
+    return len(text.split())
 
-def validate_word_count(content, desktop_limit=None, mobile_limit=None):
+class StreamingWordCounter:
+    """
+    Incremental word counter for text fed in chunks
+
+    Memory use is bounded by the chunk size and the longest line (up to
+    MAX_CARRY), not by the size of the text. With strip_markup, HTML tags,
+    comments, script and style content, Markdown syntax and URLs are not
+    counted, link text is, and counts are split into sections at each HTML
+    or Markdown heading.
+    """
+
+    def __init__(self, strip_markup=True):
+        """
+        Start counting
+
+        Args:
+            strip_markup (bool, optional): Skip markup and report per-section counts.
+                When False, words are whitespace-separated tokens as in count_words.
+        """
+        self.strip_markup = strip_markup
+        self.word_count = 0
+        self.sections = [{"heading": None, "word_count": 0}]
+        self._carry = ""
+        self._skip_until = None
+        self._resume_skip = None
+        self._at_line_start = True
+        self._heading_words = None
+
+    def feed(self, text):
+        """
+        Count the words in the next chunk of text
+
+        Args:
+            text (str): The next chunk
+        """
+        buffer = self._carry + text
+        cut = buffer.rfind("\n") + 1
+        if not cut and len(buffer) > MAX_CARRY:
+            # A very long line: split at whitespace so a word is never cut in two
+            cut = max(buffer.rfind(" "), buffer.rfind("\t")) + 1 or len(buffer)
+        self._carry = buffer[cut:]
+        if cut:
+            self._process(buffer[:cut])
+
+    def close(self):
+        """
+        Count any remaining text and return the totals
+
+        Returns:
+            dict: "word_count" and a list of "sections" with "heading" and "word_count"
+        """
+        if self._carry:
+            self._process(self._carry)
+            self._carry = ""
+        sections = [section for section in self.sections if section["heading"] is not None or section["word_count"]]
+        return {"word_count": self.word_count, "sections": sections}
+
+    def _process(self, segment):
+        if not self.strip_markup:
+            words = len(segment.split())
+            self.word_count += words
+            self.sections[-1]["word_count"] += words
+            return
+
+        pos = 0
+        lower = None
+        while pos < len(segment):
+            if self._skip_until:
+                if lower is None:
+                    lower = segment.lower()
+                end = lower.find(self._skip_until, pos)
+                if end < 0:
+                    break
+                pos = end + len(self._skip_until)
+                self._at_line_start = False
+                self._skip_until, self._resume_skip = self._resume_skip, None
+                continue
+
+            match = _MARKUP_START.search(segment, pos)
+            self._count_text(segment[pos:match.start() if match else len(segment)])
+            if not match:
+                break
+
+            marker = match.group(1)
+            if marker == "!--":
+                self._skip_until = "-->"
+                pos = match.end()
+                continue
+
+            name = marker.lstrip("/").lower()
+            closing = marker.startswith("/")
+            if _HTML_HEADING.fullmatch(name):
+                if closing:
+                    self._heading_words = None
+                else:
+                    self._start_section("")
+                    self._heading_words = []
+            elif name in _SKIPPED_ELEMENTS and not closing:
+                self._resume_skip = f"</{name}"
+
+            end = segment.find(">", match.end())
+            if end < 0:
+                # The tag continues in the next segment
+                if self._resume_skip:
+                    self._skip_until, self._resume_skip = ">", self._resume_skip
+                else:
+                    self._skip_until = ">"
+                break
+            pos = end + 1
+            # Text straight after a tag is mid-line, e.g. "<b>No.</b> # 1" is not a heading
+            self._at_line_start = False
+            if self._resume_skip:
+                self._skip_until, self._resume_skip = self._resume_skip, None
+
+    def _start_section(self, heading):
+        self.sections.append({"heading": heading, "word_count": 0})
+
+    def _count_text(self, text):
+        if not text:
+            return
+
+        at_line_start = self._at_line_start
+        self._at_line_start = text.endswith("\n")
+        text = _ENTITY.sub(" ", text)
+        lines = text.split("\n")
+        for index, line in enumerate(lines):
+            if index or at_line_start:
+                heading = _MARKDOWN_HEADING.match(line)
+                if heading:
+                    self._start_section(" ".join(heading.group(1).split()[:MAX_HEADING_WORDS]))
+            line = _URL.sub(" ", _MARKDOWN_LINK.sub(r" \1 ", line))
+
+            words = _WORD.findall(line)
+            if not words:
+                continue
+            self.word_count += len(words)
+            self.sections[-1]["word_count"] += len(words)
+            if self._heading_words is not None and len(self._heading_words) < MAX_HEADING_WORDS:
+                self._heading_words.extend(words[:MAX_HEADING_WORDS - len(self._heading_words)])
+                self.sections[-1]["heading"] = " ".join(self._heading_words)
+
+def count_words_stream(stream, strip_markup=True, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Count words in a file object without reading it into memory
+
+    Args:
+        stream: A text or binary file object (binary content is decoded as UTF-8)
+        strip_markup (bool, optional): Skip HTML, Markdown syntax and URLs
+        chunk_size (int, optional): Amount read per step
+
+    Returns:
+        dict: "word_count" and a list of "sections" with "heading" and "word_count"
+    """
+    counter = StreamingWordCounter(strip_markup)
+    decoder = None
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunk = decoder.decode(chunk)
+        counter.feed(chunk)
+
+    if decoder:
+        counter.feed(decoder.decode(b"", final=True))
+    return counter.close()
+
+def count_words_in_file(path, strip_markup=True, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Count words in a file through a memory map
+
+    Args:
+        path (str): Path to a UTF-8 text, HTML or Markdown file
+        strip_markup (bool, optional): Skip HTML, Markdown syntax and URLs
+        chunk_size (int, optional): Bytes decoded per step
+
+    Returns:
+        dict: "word_count" and a list of "sections" with "heading" and "word_count"
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return StreamingWordCounter(strip_markup).close()
+        with mapped:
+            return count_words_stream(mapped, strip_markup, chunk_size)
+
+def _count_content(content, strip_markup=False):
+    """Count words in a string or a file object"""
+    if hasattr(content, "read"):
+        return count_words_stream(content, strip_markup)["word_count"]
+    if strip_markup:
+        counter = StreamingWordCounter()
+        counter.feed(content or "")
+        return counter.close()["word_count"]
+    return count_words(content)
+
+def validate_word_count(content, desktop_limit=None, mobile_limit=None, strip_markup=False):
     """
     Validate if content meets word count requirements
     
     Args:
-        content (str): The content to validate
+        content (str or file object): The content to validate; file objects
+            are counted in a streaming pass without being loaded whole
         desktop_limit (int, optional): Maximum word count for desktop
         mobile_limit (int, optional): Maximum word count for mobile
+        strip_markup (bool, optional): Skip HTML, Markdown syntax and URLs
         
     Returns:
         tuple: (desktop_valid, mobile_valid, word_count)
     """
-    word_count = count_words(content)
+    word_count = _count_content(content, strip_markup)
     
     desktop_valid = word_count <= desktop_limit if desktop_limit else True
     mobile_valid = word_count <= mobile_limit if mobile_limit else True
     
     return (desktop_valid, mobile_valid, word_count)
 
-def get_word_count_status(content, desktop_limit=None, mobile_limit=None):
+def get_word_count_status(content, desktop_limit=None, mobile_limit=None, strip_markup=False):
     """
     Get detailed word count status information
     
     Args:
-        content (str): The content to analyze
+        content (str or file object): The content to analyze
+        desktop_limit (int, optional): Maximum word count for desktop
+        mobile_limit (int, optional): Maximum word count for mobile
+        strip_markup (bool, optional): Skip HTML, Markdown syntax and URLs
+        
+    Returns:
+        dict: Word count status information
+    """
+    return get_limit_status(_count_content(content, strip_markup), desktop_limit, mobile_limit)
+
+def get_limit_status(word_count, desktop_limit=None, mobile_limit=None):
+    """
+    Get detailed word count status information for an already counted text
+    
+    Args:
+        word_count (int): The number of words in the content
         desktop_limit (int, optional): Maximum word count for desktop
         mobile_limit (int, optional): Maximum word count for mobile
         
     Returns:
         dict: Word count status information
     """
-    desktop_valid, mobile_valid, word_count = validate_word_count(content, desktop_limit, mobile_limit)
+    desktop_valid = word_count <= desktop_limit if desktop_limit else True
+    mobile_valid = word_count <= mobile_limit if mobile_limit else True
     
     return {
         "word_count": word_count,
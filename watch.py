@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Watch Mode for the Banking Content Compliance Review System
+This script watches a directory of copy files and re-reviews each file whose content actually changes.
+"""
+
+import os
+import json
+import argparse
+import dotenv
+
+# Import our custom modules
+from utils.file_watch import DirectoryWatcher, HashManifest, scan_copy_files
+from utils.prescreen import prescreen_content
+from utils.transcript import TranscriptLog
+
+# Watcher state lives in a hidden directory inside the watched directory
+STATE_DIR = ".compliance_watch"
+
+def load_config_list():
+    """
+    Load the LLM configuration from env.local
+
+    Returns:
+        list: The config_list for the agents
+    """
+    dotenv.load_dotenv('env.local')
+
+    openai_api_key = os.environ.get("OPENAI_API_KEY")
+    if not openai_api_key or openai_api_key == "your_openai_api_key_here":
+        raise ValueError("Please set your OpenAI API key in env.local")
+
+    return [
+        {
+            "model": "gpt-4o-mini",
+            "api_key": openai_api_key
+        }
+    ]
+
+class CopyReviewer:
+    """
+    Reviews copy files whose normalized content differs from the manifest
+    """
+
+    def __init__(self, directory, desktop_limit=None, mobile_limit=None, review_fn=None):
+        self.directory = directory
+        self.desktop_limit = desktop_limit
+        self.mobile_limit = mobile_limit
+        self.review_fn = review_fn
+        self.state_dir = os.path.join(directory, STATE_DIR)
+        # Prescreen-only runs keep their own manifest, so a later full run still
+        # sends files that were only prescreened to the LLM
+        manifest_name = "manifest.json" if review_fn else "prescreen_manifest.json"
+        self.manifest = HashManifest(os.path.join(self.state_dir, manifest_name))
+
+    def review_file(self, relative):
+        """
+        Review a file if its content changed since it was last reviewed
+
+        Args:
+            relative (str): Path relative to the watched directory
+
+        Returns:
+            bool: True if the file was reviewed
+        """
+        path = os.path.join(self.directory, relative)
+        review_path = os.path.join(self.state_dir, "reviews", f"{relative}.json")
+        if not os.path.exists(path):
+            # Drop the stale review along with the manifest entry
+            self.manifest.forget(relative)
+            if os.path.exists(review_path):
+                os.remove(review_path)
+            return False
+
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+
+        if not self.manifest.needs_review(relative, content):
+            return False
+
+        prescreen = prescreen_content(content, self.desktop_limit, self.mobile_limit)
+        result = dict(prescreen, file=relative)
+        if self.review_fn:
+            result["review"] = self.review_fn(content, prescreen)
+
+        os.makedirs(os.path.dirname(review_path), exist_ok=True)
+        with open(review_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+        issues = len(prescreen["issues"])
+        limits = "OK" if prescreen["desktop_valid"] and prescreen["mobile_valid"] else "Exceeds limit"
+        print(f"Reviewed {relative}: {prescreen['word_count']} words ({limits}), {issues} potential issues")
+
+        self.manifest.record(relative, content)
+        return True
+
+    def review_files(self, paths):
+        """
+        Review the given files and persist the manifest
+
+        A file whose review fails is reported and left out of the manifest,
+        so it is retried on its next change or the next start.
+        """
+        try:
+            for relative in sorted(paths):
+                try:
+                    self.review_file(relative)
+                except Exception as e:
+                    print(f"Error reviewing {relative}: {e}")
+        finally:
+            self.manifest.save()
+
+def run_watch(args):
+    print("Banking Content Compliance Review System - Watch Mode")
+    print("----------------------------------------------------")
+
+    review_fn = None
+    transcript = None
+    if not args.prescreen_only:
+        from agents.compliance_reviewer import create_review_fn
+        os.makedirs(os.path.join(args.directory, STATE_DIR), exist_ok=True)
+        transcript = TranscriptLog(os.path.join(args.directory, STATE_DIR, "transcript.jsonl"))
+        review_fn = create_review_fn(load_config_list(), transcript)
+
+    reviewer = CopyReviewer(args.directory, args.desktop_limit, args.mobile_limit, review_fn)
+    watcher = DirectoryWatcher(
+        args.directory,
+        debounce=args.debounce,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.polling
+    )
+
+    # Catch up on edits made while we were not running; unchanged files are skipped
+    known = set(reviewer.manifest.hashes) | set(scan_copy_files(args.directory))
+    reviewer.review_files(known)
+
+    print(f"\nWatching {args.directory} ({watcher.mode}). Press Ctrl+C to stop.\n")
+    try:
+        while True:
+            reviewer.review_files(watcher.wait_for_changes())
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        if transcript:
+            transcript.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch a directory of copy files and review changes")
+    parser.add_argument("directory", help="Directory containing copy files")
+    parser.add_argument("--desktop-limit", type=int, default=None, help="Maximum word count for desktop")
+    parser.add_argument("--mobile-limit", type=int, default=None, help="Maximum word count for mobile")
+    parser.add_argument("--debounce", type=float, default=1.0, help="Seconds of quiet before reviewing edits")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between scans when polling")
+    parser.add_argument("--polling", action="store_true", help="Poll even if inotify is available")
+    parser.add_argument("--prescreen-only", action="store_true", help="Run only the local checks, no LLM review")
+
+    run_watch(parser.parse_args())
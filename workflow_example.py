@@ -5,6 +5,7 @@ This script demonstrates a complete workflow using both compliance reviewer and
 """
 
 import os
+import sys
 import json
 import dotenv
 from autogen import UserProxyAgent, GroupChat, GroupChatManager
@@ -12,6 +13,8 @@ from autogen import UserProxyAgent, GroupChat, GroupChatManager
 # Import our custom modules
 from agents.compliance_reviewer import create_compliance_reviewer_agent
 from agents.content_creator import create_content_creator_agent
+from agents.speculative_revision import create_ask_fn, run_speculative_revision
+from utils.prescreen import prescreen_content
 from utils.word_count import validate_word_count
 from utils.compliance_rules import check_common_issues
 
@@ -115,5 +118,47 @@ Let's start with the compliance review.
         message=initial_message
     )
 
+def run_speculative_workflow_example():
+    print("Banking Content Compliance Review System - Speculative Workflow Example")
+    print("----------------------------------------------------------------------")
+    
+    # Example content
+    example_content = """Grow your money faster with our Premium Saver account. With market-leading rates and 
+    instant access to your funds, there's no better place for your savings. Open an account 
+    today with just £100 and watch your money grow!"""
+    
+    # Example word count requirements
+    desktop_limit = 50
+    mobile_limit = 30
+    
+    print(f"\nExample Content:\n\"{example_content}\"\n")
+    print(f"Desktop word limit: {desktop_limit}")
+    print(f"Mobile word limit: {mobile_limit}")
+    
+    # Create our agents
+    compliance_agent = create_compliance_reviewer_agent(config_list)
+    content_creator = create_content_creator_agent(config_list)
+    
+    # Run the local checks that seed the speculative revision
+    prescreen = prescreen_content(example_content, desktop_limit, mobile_limit)
+    
+    print("\nReviewing and drafting a revision in parallel...\n")
+    print("-" * 50)
+    
+    result = run_speculative_revision(
+        create_ask_fn(compliance_agent, "ReviewCoordinator"),
+        create_ask_fn(content_creator, "RevisionCoordinator"),
+        example_content,
+        prescreen
+    )
+    
+    print("-" * 50)
+    print(f"\nSpeculative draft {result['status']}")
+    print(f"Parallel stage: {result['timings']['parallel_stage']:.1f}s, total: {result['timings']['total']:.1f}s")
+    print(f"\nFinal revision:\n{result['draft']}")
+
 if __name__ == "__main__":
-    run_workflow_example()
+    if "--speculative" in sys.argv:
+        run_speculative_workflow_example()
+    else:
+        run_workflow_example()